@@ -6,15 +6,23 @@ nicely formatted embed responses.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
 
 import aiohttp
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
 from bot import config
-from bot.utils.embeds import error_embed, info_embed, success_embed
+from bot.utils.embeds import clone_embed, error_embed, info_embed, success_embed
 
 log = logging.getLogger(__name__)
 
@@ -23,8 +31,123 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _OPENWEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+_OPENWEATHER_ICON_URL = "https://openweathermap.org/img/wn/{icon}@2x.png"
 _EXCHANGE_RATE_URL = "https://open.er-api.com/v6/latest/{base}"
 
+_OPENWEATHER_FOOTER = "Powered by OpenWeatherMap"
+_EXCHANGE_RATE_FOOTER = "Powered by exchangerate-api.com"
+
+# Memoised icon URLs:  {icon code: URL}  (OpenWeatherMap has ~18 icon codes)
+_ICON_URLS: dict[str, str] = {}
+
+# Weather responses are served from cache without a refresh for
+# _WEATHER_FRESH_TTL seconds, then served stale (while a background refresh
+# runs) until _WEATHER_STALE_TTL seconds, after which they are refetched.
+_WEATHER_FRESH_TTL = 300
+_WEATHER_STALE_TTL = 3600
+
+# Maximum number of cities kept in the weather cache (LRU eviction)
+_WEATHER_CACHE_SIZE = 256
+
+# Exchange-rate tables are cached per base currency for this many seconds
+# (the upstream only refreshes its rates once a day)
+_FX_TTL = 3600
+
+# Fields of the exchange-rate payload that are kept in the cache
+_FX_FIELDS: tuple[str, ...] = ("result", "rates", "time_last_update_utc")
+
+# Per-user rate limit shared by the API-backed commands: RATE uses per PER
+# seconds.  Protects the upstream free-tier quotas from a single user.
+_RATE_LIMIT_RATE = 3
+_RATE_LIMIT_PER = 60
+
+# ``(HTTP status, parsed payload or None)`` as returned by ``_get_json``
+_JsonResult = tuple[int, dict[str, Any] | None]
+
+# Quantum used to round converted amounts to two decimal places
+_CENT = Decimal("0.01")
+
+# Upstream retry policy: at most _MAX_RETRIES retries, never sleeping longer
+# than _MAX_RETRY_AFTER for a single Retry-After or _MAX_RETRY_WAIT in total
+_MAX_RETRIES = 2
+_MAX_RETRY_AFTER = 5.0
+_MAX_RETRY_WAIT = 3.0
+_BACKOFF_BASE = 0.25
+
+# Active ISO 4217 currency codes, used to reject bad input before any API call
+_ISO_4217: frozenset[str] = frozenset({
+    "AED", "AFN", "ALL", "AMD", "ANG", "AOA", "ARS", "AUD", "AWG", "AZN",
+    "BAM", "BBD", "BDT", "BGN", "BHD", "BIF", "BMD", "BND", "BOB", "BRL",
+    "BSD", "BTN", "BWP", "BYN", "BZD", "CAD", "CDF", "CHF", "CLP", "CNY",
+    "COP", "CRC", "CUP", "CVE", "CZK", "DJF", "DKK", "DOP", "DZD", "EGP",
+    "ERN", "ETB", "EUR", "FJD", "FKP", "GBP", "GEL", "GHS", "GIP", "GMD",
+    "GNF", "GTQ", "GYD", "HKD", "HNL", "HTG", "HUF", "IDR", "ILS", "INR",
+    "IQD", "IRR", "ISK", "JMD", "JOD", "JPY", "KES", "KGS", "KHR", "KMF",
+    "KPW", "KRW", "KWD", "KYD", "KZT", "LAK", "LBP", "LKR", "LRD", "LSL",
+    "LYD", "MAD", "MDL", "MGA", "MKD", "MMK", "MNT", "MOP", "MRU", "MUR",
+    "MVR", "MWK", "MXN", "MYR", "MZN", "NAD", "NGN", "NIO", "NOK", "NPR",
+    "NZD", "OMR", "PAB", "PEN", "PGK", "PHP", "PKR", "PLN", "PYG", "QAR",
+    "RON", "RSD", "RUB", "RWF", "SAR", "SBD", "SCR", "SDG", "SEK", "SGD",
+    "SHP", "SLE", "SLL", "SOS", "SRD", "SSP", "STN", "SVC", "SYP", "SZL",
+    "THB", "TJS", "TMT", "TND", "TOP", "TRY", "TTD", "TWD", "TZS", "UAH",
+    "UGX", "USD", "UYU", "UZS", "VED", "VES", "VND", "VUV", "WST", "XAF",
+    "XCD", "XCG", "XDR", "XOF", "XPF", "YER", "ZAR", "ZMW", "ZWG", "ZWL",
+})
+
+
+# ---------------------------------------------------------------------------
+# Static error embeds (cloned per response via ``clone_embed``)
+# ---------------------------------------------------------------------------
+
+_GENERIC_ERROR_EMBED = error_embed(
+    "Unexpected Error",
+    "Something went wrong. Please try again later.",
+)
+_ERR_API_KEY_MISSING = error_embed(
+    "API Configuration Error",
+    "The OpenWeatherMap API key has not been configured.",
+)
+_ERR_API_KEY_INVALID = error_embed(
+    "API Configuration Error",
+    "The weather API key is invalid. Please contact a bot administrator.",
+)
+_ERR_NETWORK_WEATHER = error_embed(
+    "Network Error",
+    "Could not fetch weather data. Please try again later.",
+)
+_ERR_WEATHER = error_embed(
+    "Weather Error",
+    "Could not fetch weather data. Please try again later.",
+)
+_ERR_NETWORK_FX = error_embed(
+    "Network Error",
+    "Could not fetch exchange rate data. Please try again later.",
+)
+_ERR_FX = error_embed(
+    "Exchange Rate Error",
+    "Could not fetch exchange rate data. Please try again later.",
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _fx_url(base: str) -> str:
+    """Return the exchange-rate URL for *base* (bounded by ``_ISO_4217``)."""
+    return _EXCHANGE_RATE_URL.format(base=base)
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float:
+    """Return the ``Retry-After`` delay in seconds (defaults to one second)."""
+    try:
+        return max(float(headers.get("Retry-After", "1")), 0.0)
+    except ValueError:
+        # HTTP-date form -- not worth parsing for a bounded retry
+        return 1.0
+
 
 # ---------------------------------------------------------------------------
 # Cog
@@ -36,18 +159,204 @@ class Integrations(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.session: aiohttp.ClientSession | None = None
+
+        # Shared HTTP session owned by the bot (created and closed in main.py)
+        self.session: aiohttp.ClientSession = bot.http_session  # type: ignore[attr-defined]
+
+        # Base OpenWeatherMap query params, bound once (``None`` if no API key)
+        self._owm_base_params: dict[str, str] | None = (
+            {"appid": config.OPENWEATHER_API_KEY, "units": "metric"}
+            if config.OPENWEATHER_API_KEY
+            else None
+        )
+
+        # Weather cache:  {normalised city: (fresh until, stale until, payload)}
+        self._weather_cache: OrderedDict[
+            str, tuple[float, float, dict[str, Any]]
+        ] = OrderedDict()
+
+        # In-flight upstream requests shared by concurrent identical lookups
+        self._weather_inflight: dict[str, asyncio.Task[_JsonResult]] = {}
+        self._fx_inflight: dict[str, asyncio.Task[_JsonResult]] = {}
+
+        # Background stale-while-revalidate refreshes:  {normalised city: task}
+        self._weather_refreshes: dict[str, asyncio.Task[None]] = {}
+
+        # Exchange-rate cache:  {base currency: (monotonic timestamp, payload)}
+        self._fx_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
-    async def cog_load(self) -> None:
-        self.session = aiohttp.ClientSession()
-
     async def cog_unload(self) -> None:
-        if self.session is not None:
-            await self.session.close()
+        """Cancel any background cache refreshes still in flight."""
+        for task in self._weather_refreshes.values():
+            task.cancel()
+
+    # ------------------------------------------------------------------
+    # Response helper
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def _reply(interaction: discord.Interaction, **kwargs: Any) -> None:
+        """Respond to *interaction*, using the followup webhook once deferred."""
+        if interaction.response.is_done():
+            await interaction.followup.send(**kwargs)
+        else:
+            await interaction.response.send_message(**kwargs)
+
+    # ------------------------------------------------------------------
+    # HTTP helper
+    # ------------------------------------------------------------------
+
+    async def _get_json(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+    ) -> _JsonResult:
+        """GET *url* and return ``(status, payload)``.
+
+        The payload is only parsed for ``200`` responses and is ``None``
+        otherwise.  ``429`` responses are retried after the upstream's
+        ``Retry-After`` delay and network errors with exponential backoff,
+        up to :data:`_MAX_RETRIES` times and :data:`_MAX_RETRY_WAIT` seconds
+        in total so the deferred interaction never expires.  The last network
+        error is re-raised once retries are exhausted.
+        """
+        attempt = 0
+        waited = 0.0
+        while True:
+            try:
+                async with self.session.get(url, params=params) as resp:
+                    if resp.status == 200:
+                        return resp.status, await resp.json(loads=orjson.loads)
+                    if resp.status != 429:
+                        return resp.status, None
+                    delay = min(_parse_retry_after(resp.headers), _MAX_RETRY_AFTER)
+                    if attempt >= _MAX_RETRIES or waited + delay > _MAX_RETRY_WAIT:
+                        return resp.status, None
+                    log.warning("Rate limited by %s, retrying in %.2fs", url, delay)
+            except (aiohttp.ClientError, TimeoutError):
+                delay = _BACKOFF_BASE * 2**attempt
+                if attempt >= _MAX_RETRIES or waited + delay > _MAX_RETRY_WAIT:
+                    raise
+
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    async def _get_json_shared(
+        self,
+        inflight: dict[str, asyncio.Task[_JsonResult]],
+        key: str,
+        url: str,
+        params: dict[str, str] | None = None,
+    ) -> _JsonResult:
+        """:meth:`_get_json`, collapsing concurrent calls for the same *key*.
+
+        The first caller starts the request; everyone else awaits the same
+        task.  The task is shielded so one cancelled caller can't abort the
+        request for the others.
+        """
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._get_json(url, params))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    # ------------------------------------------------------------------
+    # Weather cache helpers
+    # ------------------------------------------------------------------
+
+    def _get_cached_weather(self, key: str) -> tuple[dict[str, Any] | None, bool]:
+        """Return ``(payload, is_stale)`` for *key*.
+
+        The payload is ``None`` if nothing is cached or the entry is past its
+        stale window; ``is_stale`` is ``True`` when the payload should be
+        served but refreshed in the background.
+        """
+        entry = self._weather_cache.get(key)
+        if entry is None:
+            return None, False
+        fresh_until, stale_until, data = entry
+        now = time.monotonic()
+        if now >= stale_until:
+            # Expired -- evict lazily on read
+            del self._weather_cache[key]
+            return None, False
+        self._weather_cache.move_to_end(key)
+        return data, now >= fresh_until
+
+    def _cache_weather(self, key: str, data: dict[str, Any]) -> None:
+        """Store *data* under *key*, evicting the least recently used entry."""
+        now = time.monotonic()
+        self._weather_cache[key] = (
+            now + _WEATHER_FRESH_TTL,
+            now + _WEATHER_STALE_TTL,
+            data,
+        )
+        self._weather_cache.move_to_end(key)
+        if len(self._weather_cache) > _WEATHER_CACHE_SIZE:
+            self._weather_cache.popitem(last=False)
+
+    def _schedule_weather_refresh(self, key: str, params: dict[str, str]) -> None:
+        """Refresh a stale entry in the background (at most one task per city)."""
+        if key in self._weather_refreshes:
+            return
+        task = asyncio.create_task(self._refresh_weather(key, params))
+        self._weather_refreshes[key] = task
+        task.add_done_callback(lambda _: self._weather_refreshes.pop(key, None))
+
+    async def _refresh_weather(self, key: str, params: dict[str, str]) -> None:
+        """Fetch fresh weather for *key* and update the cache on success."""
+        try:
+            status, data = await self._get_json_shared(
+                self._weather_inflight, key, _OPENWEATHER_URL, params,
+            )
+        except (aiohttp.ClientError, TimeoutError):
+            log.warning("Background weather refresh for '%s' failed", key)
+            return
+        if data is not None:
+            self._cache_weather(key, data)
+        else:
+            log.warning(
+                "Background weather refresh for '%s' returned status %d",
+                key,
+                status,
+            )
+
+    # ------------------------------------------------------------------
+    # Exchange-rate cache helpers
+    # ------------------------------------------------------------------
+
+    def _get_cached_rates(self, base: str) -> dict[str, Any] | None:
+        """Return the cached rate table for *base*, or ``None`` if missing/expired."""
+        entry = self._fx_cache.get(base)
+        if entry is None or time.monotonic() - entry[0] >= _FX_TTL:
+            return None
+        return entry[1]
+
+    def _cache_rates(self, base: str, data: dict[str, Any]) -> None:
+        """Store *data* for *base* unless it would degrade the cached table.
+
+        Failed responses are never stored, and while the cached table is
+        still fresh neither is one with fewer rates, so a transient upstream
+        hiccup cannot poison the cache.  An expired entry is always replaced.
+        """
+        if data.get("result") != "success":
+            return
+        entry = self._fx_cache.get(base)
+        if (
+            entry is not None
+            and time.monotonic() - entry[0] < _FX_TTL
+            and len(data.get("rates", {})) < len(entry[1].get("rates", {}))
+        ):
+            return
+        # Only keep the fields /convert reads; drop the upstream's metadata
+        trimmed = {field: data[field] for field in _FX_FIELDS if field in data}
+        self._fx_cache[base] = (time.monotonic(), trimmed)
 
     # ==================================================================
     # Slash commands
@@ -60,80 +369,77 @@ class Integrations(commands.Cog):
         description="Get the current weather for a city",
     )
     @app_commands.describe(city="Name of the city to look up")
+    @app_commands.checks.cooldown(_RATE_LIMIT_RATE, _RATE_LIMIT_PER)
     async def weather(
         self,
         interaction: discord.Interaction,
         city: str,
     ) -> None:
-        assert self.session is not None
-
-        if not config.OPENWEATHER_API_KEY:
+        if self._owm_base_params is None:
             await interaction.response.send_message(
-                embed=error_embed(
-                    "API Configuration Error",
-                    "The OpenWeatherMap API key has not been configured.",
-                ),
+                embed=clone_embed(_ERR_API_KEY_MISSING),
                 ephemeral=True,
             )
             return
 
-        params = {
-            "q": city,
-            "appid": config.OPENWEATHER_API_KEY,
-            "units": "metric",
-        }
-
-        try:
-            async with self.session.get(_OPENWEATHER_URL, params=params) as resp:
-                if resp.status == 404:
-                    await interaction.response.send_message(
-                        embed=error_embed(
-                            "City Not Found",
-                            f"Could not find a city matching **{city}**. "
-                            "Please check the spelling and try again.",
-                        ),
-                        ephemeral=True,
-                    )
-                    return
-
-                if resp.status == 401:
-                    log.error("OpenWeatherMap API key is invalid or expired")
-                    await interaction.response.send_message(
-                        embed=error_embed(
-                            "API Configuration Error",
-                            "The weather API key is invalid. "
-                            "Please contact a bot administrator.",
-                        ),
-                        ephemeral=True,
-                    )
-                    return
-
-                if resp.status != 200:
-                    log.warning(
-                        "OpenWeatherMap returned unexpected status %d",
-                        resp.status,
-                    )
-                    await interaction.response.send_message(
-                        embed=error_embed(
-                            "Weather Error",
-                            "Could not fetch weather data. Please try again later.",
-                        ),
-                        ephemeral=True,
-                    )
-                    return
-
-                data = await resp.json()
-
-        except (aiohttp.ClientError, TimeoutError):
-            log.exception("Network error while fetching weather data")
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Network Error",
-                    "Could not fetch weather data. Please try again later.",
-                ),
-                ephemeral=True,
-            )
-            return
+        key = city.strip().lower()
+        params = {"q": city, **self._owm_base_params}
+        data, is_stale = self._get_cached_weather(key)
+
+        if is_stale:
+            self._schedule_weather_refresh(key, params)
+
+        if data is None:
+            # Acknowledge now so a slow upstream can't exceed Discord's 3 s window
+            await interaction.response.defer(thinking=True)
+
+            try:
+                status, data = await self._get_json_shared(
+                    self._weather_inflight, key, _OPENWEATHER_URL, params,
+                )
+            except (aiohttp.ClientError, TimeoutError):
+                log.exception("Network error while fetching weather data")
+                await self._reply(
+                    interaction,
+                    embed=clone_embed(_ERR_NETWORK_WEATHER),
+                    ephemeral=True,
+                )
+                return
+
+            if status == 404:
+                await self._reply(
+                    interaction,
+                    embed=error_embed(
+                        "City Not Found",
+                        f"Could not find a city matching **{city}**. "
+                        "Please check the spelling and try again.",
+                    ),
+                    ephemeral=True,
+                )
+                return
+
+            if status == 401:
+                log.error("OpenWeatherMap API key is invalid or expired")
+                await self._reply(
+                    interaction,
+                    embed=clone_embed(_ERR_API_KEY_INVALID),
+                    ephemeral=True,
+                )
+                return
+
+            if data is None:
+                log.warning(
+                    "OpenWeatherMap returned unexpected status %d",
+                    status,
+                )
+                await self._reply(
+                    interaction,
+                    embed=clone_embed(_ERR_WEATHER),
+                    ephemeral=True,
+                )
+                return
+
+            self._cache_weather(key, data)
 
         # Build the embed from the API response
         city_name: str = data["name"]
@@ -142,38 +448,28 @@ class Integrations(commands.Cog):
         wind_info = data["wind"]
 
         icon_code: str = weather_info["icon"]
-        icon_url = f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
+        icon_url = _ICON_URLS.get(icon_code) or _ICON_URLS.setdefault(
+            icon_code,
+            _OPENWEATHER_ICON_URL.format(icon=icon_code),
+        )
 
         embed = info_embed(title=f"Weather in {city_name}")
         embed.set_thumbnail(url=icon_url)
-        embed.add_field(
-            name="Temperature",
-            value=f"{main_info['temp']}\u00b0C (feels like: {main_info['feels_like']}\u00b0C)",
-            inline=True,
-        )
-        embed.add_field(
-            name="Description",
-            value=weather_info["description"].capitalize(),
-            inline=True,
-        )
-        embed.add_field(
-            name="Humidity",
-            value=f"{main_info['humidity']}%",
-            inline=True,
-        )
-        embed.add_field(
-            name="Wind",
-            value=f"{wind_info['speed']} m/s",
-            inline=True,
-        )
-        embed.add_field(
-            name="Pressure",
-            value=f"{main_info['pressure']} hPa",
-            inline=True,
-        )
-        embed.set_footer(text="Powered by OpenWeatherMap")
-
-        await interaction.response.send_message(embed=embed)
+        for name, value, inline in (
+            (
+                "Temperature",
+                f"{main_info['temp']}\u00b0C (feels like: {main_info['feels_like']}\u00b0C)",
+                True,
+            ),
+            ("Description", weather_info["description"].capitalize(), True),
+            ("Humidity", f"{main_info['humidity']}%", True),
+            ("Wind", f"{wind_info['speed']} m/s", True),
+            ("Pressure", f"{main_info['pressure']} hPa", True),
+        ):
+            embed.add_field(name=name, value=value, inline=inline)
+        embed.set_footer(text=_OPENWEATHER_FOOTER)
+
+        await self._reply(interaction, embed=embed)
 
     # --- /convert -----------------------------------------------------
 
@@ -186,6 +482,7 @@ class Integrations(commands.Cog):
         from_currency="Source currency code (e.g. USD, EUR, GBP)",
         to_currency="Target currency code (e.g. USD, EUR, GBP)",
     )
+    @app_commands.checks.cooldown(_RATE_LIMIT_RATE, _RATE_LIMIT_PER)
     async def convert(
         self,
         interaction: discord.Interaction,
@@ -193,8 +490,6 @@ class Integrations(commands.Cog):
         from_currency: str,
         to_currency: str,
     ) -> None:
-        assert self.session is not None
-
         # Validate amount
         if amount <= 0:
             await interaction.response.send_message(
@@ -210,46 +505,57 @@ class Integrations(commands.Cog):
         from_currency = from_currency.upper().strip()
         to_currency = to_currency.upper().strip()
 
-        if len(from_currency) != 3 or not from_currency.isalpha():
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Invalid Currency Code",
-                    f"**{from_currency}** is not a valid 3-letter currency code.",
-                ),
-                ephemeral=True,
-            )
-            return
-
-        if len(to_currency) != 3 or not to_currency.isalpha():
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Invalid Currency Code",
-                    f"**{to_currency}** is not a valid 3-letter currency code.",
-                ),
-                ephemeral=True,
-            )
-            return
-
-        url = _EXCHANGE_RATE_URL.format(base=from_currency)
-
-        try:
-            async with self.session.get(url) as resp:
-                data = await resp.json()
-
-        except (aiohttp.ClientError, TimeoutError):
-            log.exception("Network error while fetching exchange rates")
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Network Error",
-                    "Could not fetch exchange rate data. Please try again later.",
-                ),
-                ephemeral=True,
-            )
-            return
-
-        # The API returns "result": "success" on success
-        if data.get("result") != "success":
-            await interaction.response.send_message(
+        for code in (from_currency, to_currency):
+            if code not in _ISO_4217:
+                await interaction.response.send_message(
+                    embed=error_embed(
+                        "Invalid Currency Code",
+                        f"**{code}** is not a valid ISO 4217 currency code.",
+                    ),
+                    ephemeral=True,
+                )
+                return
+
+        data = self._get_cached_rates(from_currency)
+
+        if data is None:
+            # Acknowledge now so a slow upstream can't exceed Discord's 3 s window
+            await interaction.response.defer(thinking=True)
+
+            url = _fx_url(from_currency)
+
+            try:
+                status, data = await self._get_json_shared(
+                    self._fx_inflight, from_currency, url,
+                )
+            except (aiohttp.ClientError, TimeoutError):
+                log.exception("Network error while fetching exchange rates")
+                await self._reply(
+                    interaction,
+                    embed=clone_embed(_ERR_NETWORK_FX),
+                    ephemeral=True,
+                )
+                return
+
+            if data is None and status != 404:
+                log.warning(
+                    "Exchange-rate API returned unexpected status %d",
+                    status,
+                )
+                await self._reply(
+                    interaction,
+                    embed=clone_embed(_ERR_FX),
+                    ephemeral=True,
+                )
+                return
+
+            if data is not None:
+                self._cache_rates(from_currency, data)
+
+        # The API returns "result": "success" on success (404 for unknown bases)
+        if data is None or data.get("result") != "success":
+            await self._reply(
+                interaction,
                 embed=error_embed(
                     "Invalid Currency",
                     f"**{from_currency}** is not a supported currency code.",
@@ -261,7 +567,8 @@ class Integrations(commands.Cog):
         rates: dict[str, float] = data.get("rates", {})
 
         if to_currency not in rates:
-            await interaction.response.send_message(
+            await self._reply(
+                interaction,
                 embed=error_embed(
                     "Invalid Currency",
                     f"**{to_currency}** is not a supported currency code.",
@@ -271,27 +578,23 @@ class Integrations(commands.Cog):
             return
 
         rate: float = rates[to_currency]
-        result = round(amount * rate, 2)
+        # Decimal arithmetic avoids binary float drift in the displayed result
+        result = (Decimal(str(amount)) * Decimal(str(rate))).quantize(_CENT, ROUND_HALF_UP)
 
         last_updated: str = data.get("time_last_update_utc", "Unknown")
 
         embed = success_embed(
             title="Currency Conversion",
-            description=f"**{amount:,.2f} {from_currency}** = **{result:,.2f} {to_currency}**",
-        )
-        embed.add_field(
-            name="Rate",
-            value=f"1 {from_currency} = {rate} {to_currency}",
-            inline=True,
-        )
-        embed.add_field(
-            name="Last Updated",
-            value=last_updated,
-            inline=True,
+            description=f"**{amount:,.2f} {from_currency}** = **{result:,} {to_currency}**",
         )
-        embed.set_footer(text="Powered by exchangerate-api.com")
+        for name, value, inline in (
+            ("Rate", f"1 {from_currency} = {rate} {to_currency}", True),
+            ("Last Updated", last_updated, True),
+        ):
+            embed.add_field(name=name, value=value, inline=inline)
+        embed.set_footer(text=_EXCHANGE_RATE_FOOTER)
 
-        await interaction.response.send_message(embed=embed)
+        await self._reply(interaction, embed=embed)
 
     # ==================================================================
     # Error handler
@@ -303,16 +606,27 @@ class Integrations(commands.Cog):
         error: app_commands.AppCommandError,
     ) -> None:
         """Handle errors raised by slash commands in this cog."""
-        log.exception("Unhandled error in integrations cog", exc_info=error)
 
-        embed = error_embed(
-            "Unexpected Error",
-            "Something went wrong. Please try again later.",
+        # Per-user rate limit hit
+        if isinstance(error, app_commands.CommandOnCooldown):
+            await self._reply(
+                interaction,
+                embed=error_embed(
+                    "Slow Down",
+                    "You're using this command too quickly. "
+                    f"Try again in **{error.retry_after:.0f}s**.",
+                ),
+                ephemeral=True,
+            )
+            return
+
+        # Unknown -- log and surface a generic message
+        log.exception("Unhandled error in integrations cog", exc_info=error)
+        await self._reply(
+            interaction,
+            embed=clone_embed(_GENERIC_ERROR_EMBED),
+            ephemeral=True,
         )
-        if interaction.response.is_done():
-            await interaction.followup.send(embed=embed, ephemeral=True)
-        else:
-            await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 # ---------------------------------------------------------------------------
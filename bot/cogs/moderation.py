@@ -6,28 +6,32 @@ Provides slash commands that require moderator permissions and an
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import re
 import time
-from collections import defaultdict
+from collections import Counter, OrderedDict, deque
 from datetime import timedelta
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from bot import config
-from bot.utils.database import add_warning, get_warning_count, get_warnings
+from bot.utils.database import add_warning_and_count, get_warnings_with_count
 from bot.utils.embeds import (
+    clone_embed,
     error_embed,
     info_embed,
     mod_log_embed,
     success_embed,
     warning_embed,
 )
-from bot.utils.permissions import is_moderator, on_permission_error
+from bot.utils.permissions import MODERATOR_MASK, is_moderator, on_permission_error
 
 log = logging.getLogger(__name__)
 
@@ -35,13 +39,16 @@ log = logging.getLogger(__name__)
 # Duration parser  (e.g. "10m", "1h", "1d", "30s")
 # ---------------------------------------------------------------------------
 
-_DURATION_RE = re.compile(r"^(\d+)\s*([smhd])$", re.IGNORECASE)
-
-_DURATION_UNITS: dict[str, str] = {
-    "s": "seconds",
-    "m": "minutes",
-    "h": "hours",
-    "d": "days",
+# Seconds per duration unit (both cases, so parsing needn't lowercase)
+_DURATION_SECONDS: dict[str, int] = {
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "S": 1,
+    "M": 60,
+    "H": 3600,
+    "D": 86400,
 }
 
 _MAX_TIMEOUT = timedelta(days=28)
@@ -53,12 +60,59 @@ def _parse_duration(raw: str) -> timedelta | None:
     Accepted formats: ``30s``, ``10m``, ``1h``, ``7d``.
     Returns ``None`` if the string cannot be parsed.
     """
-    match = _DURATION_RE.match(raw.strip())
-    if match is None:
+    raw = raw.strip()
+    multiplier = _DURATION_SECONDS.get(raw[-1:])
+    number = raw[:-1].rstrip()
+    if multiplier is None or not number.isdecimal():
+        return None
+    return timedelta(seconds=int(number) * multiplier)
+
+
+# ---------------------------------------------------------------------------
+# Word-filter pattern
+# ---------------------------------------------------------------------------
+
+
+def _trie_pattern(words: set[str]) -> str:
+    """Return a regex source matching any of *words*, factored as a trie.
+
+    ``re`` tries a flat alternation one branch at a time at every position,
+    so its cost grows with the size of the blocklist.  Sharing common
+    prefixes means each position only walks the branches that still match.
+    Optional suffixes are greedy, so longer words are tried first.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None  # end-of-word marker
+
+    def render(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return render(trie)
+
+
+def _compile_word_filter(words: list[str]) -> re.Pattern[str] | None:
+    """Compile *words* into one casefolded whole-word pattern.
+
+    The pattern is meant to be searched against casefolded message content.
+    Each word only matches when it is not embedded in a longer word, and the
+    whole blocklist is checked in a single regex search.  Returns ``None``
+    if *words* is empty.
+    """
+    unique = {w.casefold() for w in words if w}
+    if not unique:
         return None
-    value = int(match.group(1))
-    unit = match.group(2).lower()
-    return timedelta(**{_DURATION_UNITS[unit]: value})  # type: ignore[arg-type]
+    return re.compile(rf"(?<!\w)(?:{_trie_pattern(unique)})(?!\w)")
 
 
 # ---------------------------------------------------------------------------
@@ -66,25 +120,126 @@ def _parse_duration(raw: str) -> timedelta | None:
 # ---------------------------------------------------------------------------
 
 
+# Maximum number of (guild, member) pairs tracked at once (LRU eviction)
+_MAX_TRACKED_MEMBERS = 50_000
+
+# Messages kept per member beyond the spam threshold
+_SPAM_HISTORY_SLACK = 5
+
+
+def _content_digest(content: str) -> int:
+    """Return a 64-bit BLAKE2b digest of *content* as an int.
+
+    The spam tracker only needs equality between messages, so it stores this
+    fixed-size digest instead of the (up to 4000 character) message text.
+    """
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
 class _MessageRecord:
-    """Tracks recent messages for a single guild member."""
+    """Tracks recent messages (by content digest) for a single guild member.
 
-    __slots__ = ("messages",)
+    At most *maxlen* messages are kept; adding to a full record evicts the
+    oldest one, so a member's footprint stays constant however fast they post.
+    """
+
+    __slots__ = ("messages", "counts")
 
-    def __init__(self) -> None:
-        # list of (content, timestamp) pairs
-        self.messages: list[tuple[str, float]] = []
+    def __init__(self, maxlen: int) -> None:
+        # (content digest, timestamp, channel ID, message ID), oldest first
+        self.messages: deque[tuple[int, float, int, int]] = deque(maxlen=maxlen)
+        # content digest -> number of occurrences in ``messages``
+        self.counts: Counter[int] = Counter()
 
-    def add(self, content: str, now: float) -> None:
-        self.messages.append((content, now))
+    def add(self, digest: int, now: float, channel_id: int, message_id: int) -> int:
+        """Store a message and return how many stored messages share *digest*."""
+        if len(self.messages) == self.messages.maxlen:
+            self._evict_oldest()
+        self.messages.append((digest, now, channel_id, message_id))
+        count = self.counts[digest] = self.counts[digest] + 1
+        return count
 
     def prune(self, cutoff: float) -> None:
         """Remove entries older than *cutoff*."""
-        self.messages = [(c, t) for c, t in self.messages if t >= cutoff]
+        while self.messages and self.messages[0][1] < cutoff:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        digest = self.messages.popleft()[0]
+        self.counts[digest] -= 1
+        if not self.counts[digest]:
+            del self.counts[digest]
 
-    def identical_count(self, content: str) -> int:
-        """Return how many stored messages are identical to *content*."""
-        return sum(1 for c, _ in self.messages if c == content)
+    def identical_count(self, digest: int) -> int:
+        """Return how many stored messages share the content *digest*."""
+        return self.counts[digest]
+
+    def message_ids(self, channel_id: int) -> list[int]:
+        """Return the IDs of the stored messages sent in *channel_id*."""
+        return [m[3] for m in self.messages if m[2] == channel_id]
+
+
+# ---------------------------------------------------------------------------
+# Static error embeds (cloned per response via ``clone_embed``)
+# ---------------------------------------------------------------------------
+
+_ERR_INVALID_DURATION = error_embed(
+    "Invalid Duration",
+    'Please use a format like `30s`, `10m`, `1h`, or `7d`.',
+)
+_ERR_DURATION_TOO_LONG = error_embed(
+    "Duration Too Long",
+    "Discord limits timeouts to a maximum of **28 days**.",
+)
+_ERR_MEMBER_NOT_FOUND = error_embed(
+    "Member Not Found",
+    "I couldn't find that member in this server.",
+)
+_GENERIC_ERROR_EMBED = error_embed(
+    "Unexpected Error",
+    "Something went wrong. Please try again later.",
+)
+
+
+# ---------------------------------------------------------------------------
+# Hierarchy pre-flight
+# ---------------------------------------------------------------------------
+
+_F = TypeVar("_F", bound=Callable[..., Awaitable[None]])
+
+
+def _requires_actionable_member(title: str) -> Callable[[_F], _F]:
+    """Refuse the command when the bot cannot act on the target member.
+
+    Wraps a command callback taking ``(self, interaction, member, ...)`` and
+    replies with an ephemeral error embed titled *title* instead of running
+    it when *member*'s top role is not below the bot's.
+    """
+
+    refusal = error_embed(title, "That member has a higher or equal role than me.")
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        async def wrapper(
+            self: Moderation,
+            interaction: discord.Interaction,
+            member: discord.Member,
+            *args: Any,
+            **kwargs: Any,
+        ) -> None:
+            assert interaction.guild is not None
+            if not self._can_action_member(interaction.guild, member):
+                await interaction.response.send_message(
+                    embed=clone_embed(refusal),
+                    ephemeral=True,
+                )
+                return
+            await func(self, interaction, member, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
 
 
 # ---------------------------------------------------------------------------
@@ -101,10 +256,45 @@ class Moderation(commands.Cog):
         # Load config.json once at init; reload on cog_load if needed.
         self._config: dict[str, Any] = self._load_config()
 
+        # Settings read on every message, bound once so the hot path is a
+        # plain attribute load instead of a dict lookup with a default.
+        self._word_filter: list[str] = self._config.get("word_filter", [])
+        self._spam_threshold = int(self._config.get("spam_threshold", 5))
+        self._spam_interval = float(self._config.get("spam_interval", 10))
+        # A non-positive threshold turns spam detection off
+        self._spam_enabled = self._spam_threshold > 0
+        self._spam_history = self._spam_threshold + _SPAM_HISTORY_SLACK
+        self._mod_log_channel_name: str = self._config.get("mod_log_channel", "mod-log")
+
+        # Word filter compiled once from the config
+        self._word_filter_re = _compile_word_filter(self._word_filter)
+
+        # Resolved mod-log channel per guild:  {guild_id: channel or None}
+        # Dropped whenever a channel in that guild is created, edited or
+        # deleted, so renames are picked up on the next lookup.
+        self._mod_log_cache: dict[int, discord.TextChannel | None] = {}
+
         # In-memory spam tracker:  {(guild_id, user_id): _MessageRecord}
-        self._spam_tracker: defaultdict[tuple[int, int], _MessageRecord] = defaultdict(
-            _MessageRecord,
-        )
+        # Ordered by recency so the least recently active member is evicted.
+        self._spam_tracker: OrderedDict[tuple[int, int], _MessageRecord] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def cog_load(self) -> None:
+        """Start sweeping the spam tracker once per spam interval.
+
+        A non-positive interval can't drive the loop; the tracker's LRU cap
+        still bounds its size.
+        """
+        if not self._spam_enabled or self._spam_interval <= 0:
+            return
+        self._sweep_spam_tracker.change_interval(seconds=self._spam_interval)
+        self._sweep_spam_tracker.start()
+
+    async def cog_unload(self) -> None:
+        self._sweep_spam_tracker.cancel()
 
     # ------------------------------------------------------------------
     # Config helpers
@@ -120,18 +310,85 @@ class Moderation(commands.Cog):
     # ------------------------------------------------------------------
 
     async def _send_mod_log(self, guild: discord.Guild, embed: discord.Embed) -> None:
-        """Find the configured mod-log channel and send *embed* to it."""
-        channel_name: str = self._config.get("mod_log_channel", "mod-log")
-        channel = discord.utils.get(guild.text_channels, name=channel_name)
+        """Find the configured mod-log channel and send *embed* to it.
+
+        Failures are logged rather than raised: the action itself has
+        already succeeded and been reported to the moderator.
+        """
+        try:
+            channel = self._mod_log_cache[guild.id]
+        except KeyError:
+            channel = self._mod_log_cache[guild.id] = discord.utils.get(
+                guild.text_channels, name=self._mod_log_channel_name
+            )
         if channel is None:
             log.warning(
                 "Mod-log channel '%s' not found in guild %s (%s)",
-                channel_name,
+                self._mod_log_channel_name,
                 guild.name,
                 guild.id,
             )
             return
-        await channel.send(embed=embed)
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException as exc:
+            log.warning(
+                "Failed to send mod-log entry to #%s in guild %s (%s): %s",
+                channel.name,
+                guild.name,
+                guild.id,
+                exc,
+            )
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self._mod_log_cache.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel,
+    ) -> None:
+        self._mod_log_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._mod_log_cache.pop(channel.guild.id, None)
+
+    # ------------------------------------------------------------------
+    # Response helper
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def _reply(
+        interaction: discord.Interaction,
+        embed: discord.Embed,
+        *,
+        ephemeral: bool = True,
+    ) -> None:
+        """Send *embed*, using the followup webhook once the response is done.
+
+        A failed send (e.g. an expired interaction) is logged instead of
+        propagating out of the error handler.
+        """
+        send = (
+            interaction.followup.send
+            if interaction.response.is_done()
+            else interaction.response.send_message
+        )
+        try:
+            await send(embed=embed, ephemeral=ephemeral)
+        except discord.HTTPException:
+            log.warning("Failed to reply to interaction %s", interaction.id)
+
+    @staticmethod
+    async def _try_dm(member: discord.Member, embed: discord.Embed) -> None:
+        """DM *embed* to *member*, ignoring closed DMs and API errors."""
+        try:
+            await member.send(embed=embed)
+        except discord.HTTPException:
+            pass
 
     # ------------------------------------------------------------------
     # Hierarchy check
@@ -158,6 +415,7 @@ class Moderation(commands.Cog):
         reason="Reason for the kick",
     )
     @is_moderator()
+    @_requires_actionable_member("Cannot Kick")
     async def kick(
         self,
         interaction: discord.Interaction,
@@ -167,43 +425,38 @@ class Moderation(commands.Cog):
         assert interaction.guild is not None
         assert isinstance(interaction.user, discord.Member)
 
-        if not self._can_action_member(interaction.guild, member):
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Cannot Kick",
-                    "That member has a higher or equal role than me.",
-                ),
-                ephemeral=True,
-            )
-            return
-
-        # DM the user before kicking (best-effort)
-        try:
-            await member.send(
-                embed=warning_embed(
-                    "You have been kicked",
-                    f"You were kicked from **{interaction.guild.name}**.\n**Reason:** {reason}",
-                ),
-            )
-        except (discord.Forbidden, discord.HTTPException):
-            pass
+        # Acknowledge first so the REST calls below can't outlast the
+        # interaction's response window.  Deliberately public: the success
+        # reply is visible to the channel, as it always was, and an error
+        # raised after this point replaces the public "thinking" placeholder.
+        await interaction.response.defer()
+
+        # DM the user before kicking (best-effort) -- afterwards they may no
+        # longer share a server with the bot
+        await self._try_dm(
+            member,
+            warning_embed(
+                "You have been kicked",
+                f"You were kicked from **{interaction.guild.name}**.\n**Reason:** {reason}",
+            ),
+        )
 
         await member.kick(reason=reason)
 
-        # Mod-log
+        # Mod-log and success reply are independent of each other
         log_embed = mod_log_embed(
             action="Member Kicked",
             moderator=interaction.user,
             target=member,
             reason=reason,
         )
-        await self._send_mod_log(interaction.guild, log_embed)
-
-        # Success reply
-        await interaction.response.send_message(
-            embed=success_embed(
-                "Member Kicked",
-                f"{member} has been kicked.\n**Reason:** {reason}",
+        await asyncio.gather(
+            self._send_mod_log(interaction.guild, log_embed),
+            interaction.followup.send(
+                embed=success_embed(
+                    "Member Kicked",
+                    f"{member} has been kicked.\n**Reason:** {reason}",
+                ),
             ),
         )
 
@@ -215,6 +468,7 @@ class Moderation(commands.Cog):
         reason="Reason for the ban",
     )
     @is_moderator()
+    @_requires_actionable_member("Cannot Ban")
     async def ban(
         self,
         interaction: discord.Interaction,
@@ -224,43 +478,38 @@ class Moderation(commands.Cog):
         assert interaction.guild is not None
         assert isinstance(interaction.user, discord.Member)
 
-        if not self._can_action_member(interaction.guild, member):
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Cannot Ban",
-                    "That member has a higher or equal role than me.",
-                ),
-                ephemeral=True,
-            )
-            return
-
-        # DM the user before banning (best-effort)
-        try:
-            await member.send(
-                embed=warning_embed(
-                    "You have been banned",
-                    f"You were banned from **{interaction.guild.name}**.\n**Reason:** {reason}",
-                ),
-            )
-        except (discord.Forbidden, discord.HTTPException):
-            pass
+        # Acknowledge first so the REST calls below can't outlast the
+        # interaction's response window.  Deliberately public: the success
+        # reply is visible to the channel, as it always was, and an error
+        # raised after this point replaces the public "thinking" placeholder.
+        await interaction.response.defer()
+
+        # DM the user before banning (best-effort) -- afterwards they may no
+        # longer share a server with the bot
+        await self._try_dm(
+            member,
+            warning_embed(
+                "You have been banned",
+                f"You were banned from **{interaction.guild.name}**.\n**Reason:** {reason}",
+            ),
+        )
 
         await member.ban(reason=reason)
 
-        # Mod-log
+        # Mod-log and success reply are independent of each other
         log_embed = mod_log_embed(
             action="Member Banned",
             moderator=interaction.user,
             target=member,
             reason=reason,
         )
-        await self._send_mod_log(interaction.guild, log_embed)
-
-        # Success reply
-        await interaction.response.send_message(
-            embed=success_embed(
-                "Member Banned",
-                f"{member} has been banned.\n**Reason:** {reason}",
+        await asyncio.gather(
+            self._send_mod_log(interaction.guild, log_embed),
+            interaction.followup.send(
+                embed=success_embed(
+                    "Member Banned",
+                    f"{member} has been banned.\n**Reason:** {reason}",
+                ),
             ),
         )
 
@@ -275,6 +524,7 @@ class Moderation(commands.Cog):
         duration='Duration string, e.g. "10m", "1h", "1d", "30s" (max 28d)',
     )
     @is_moderator()
+    @_requires_actionable_member("Cannot Mute")
     async def mute(
         self,
         interaction: discord.Interaction,
@@ -284,33 +534,17 @@ class Moderation(commands.Cog):
         assert interaction.guild is not None
         assert isinstance(interaction.user, discord.Member)
 
-        if not self._can_action_member(interaction.guild, member):
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "Cannot Mute",
-                    "That member has a higher or equal role than me.",
-                ),
-                ephemeral=True,
-            )
-            return
-
         delta = _parse_duration(duration)
         if delta is None:
             await interaction.response.send_message(
-                embed=error_embed(
-                    "Invalid Duration",
-                    'Please use a format like `30s`, `10m`, `1h`, or `7d`.',
-                ),
+                embed=clone_embed(_ERR_INVALID_DURATION),
                 ephemeral=True,
             )
             return
 
         if delta > _MAX_TIMEOUT:
             await interaction.response.send_message(
-                embed=error_embed(
-                    "Duration Too Long",
-                    "Discord limits timeouts to a maximum of **28 days**.",
-                ),
+                embed=clone_embed(_ERR_DURATION_TOO_LONG),
                 ephemeral=True,
             )
             return
@@ -380,20 +614,29 @@ class Moderation(commands.Cog):
         assert interaction.guild is not None
         assert isinstance(interaction.user, discord.Member)
 
-        # Persist warning
-        await add_warning(
+        # Acknowledge first so the DB and REST calls below can't outlast
+        # the interaction's response window (public, like /kick and /ban)
+        await interaction.response.defer()
+
+        # Persist warning and fetch the new total in one round trip
+        total = await add_warning_and_count(
             guild_id=interaction.guild.id,
             user_id=member.id,
             moderator_id=interaction.user.id,
             reason=reason,
         )
 
-        total = await get_warning_count(interaction.guild.id, member.id)
-
-        # DM the user (best-effort)
-        try:
-            await member.send(
-                embed=warning_embed(
+        # DM (best-effort), mod-log and success reply are independent
+        log_embed = mod_log_embed(
+            action="Member Warned",
+            moderator=interaction.user,
+            target=member,
+            reason=reason,
+        )
+        await asyncio.gather(
+            self._try_dm(
+                member,
+                warning_embed(
                     "You have been warned",
                     (
                         f"You received a warning in **{interaction.guild.name}**.\n"
@@ -401,27 +644,16 @@ class Moderation(commands.Cog):
                         f"**Total warnings:** {total}"
                     ),
                 ),
-            )
-        except (discord.Forbidden, discord.HTTPException):
-            pass
-
-        # Mod-log
-        log_embed = mod_log_embed(
-            action="Member Warned",
-            moderator=interaction.user,
-            target=member,
-            reason=reason,
-        )
-        await self._send_mod_log(interaction.guild, log_embed)
-
-        # Success reply
-        await interaction.response.send_message(
-            embed=success_embed(
-                "Member Warned",
-                (
-                    f"{member.mention} has been warned.\n"
-                    f"**Reason:** {reason}\n"
-                    f"**Total warnings:** {total}"
+            ),
+            self._send_mod_log(interaction.guild, log_embed),
+            interaction.followup.send(
+                embed=success_embed(
+                    "Member Warned",
+                    (
+                        f"{member.mention} has been warned.\n"
+                        f"**Reason:** {reason}\n"
+                        f"**Total warnings:** {total}"
+                    ),
                 ),
             ),
         )
@@ -441,7 +673,9 @@ class Moderation(commands.Cog):
     ) -> None:
         assert interaction.guild is not None
 
-        records = await get_warnings(interaction.guild.id, member.id)
+        records, count = await get_warnings_with_count(
+            interaction.guild.id, member.id
+        )
 
         if not records:
             await interaction.response.send_message(
@@ -453,21 +687,22 @@ class Moderation(commands.Cog):
             )
             return
 
-        lines: list[str] = []
-        for idx, record in enumerate(records, start=1):
-            mod = interaction.guild.get_member(record["moderator_id"])
-            mod_display = str(mod) if mod else f"Unknown (ID: {record['moderator_id']})"
-            lines.append(
-                f"**{idx}.** {record['reason']}\n"
-                f"   Moderator: {mod_display} | "
-                f"Date: {record['created_at']}"
-            )
+        # Resolve each distinct moderator once, however many warnings they issued
+        mods: dict[int, str] = {}
+        for mod_id in {record.moderator_id for record in records}:
+            mod = interaction.guild.get_member(mod_id)
+            mods[mod_id] = str(mod) if mod else f"Unknown (ID: {mod_id})"
 
         embed = info_embed(
             title=f"Warnings for {member}",
-            description="\n\n".join(lines),
+            description="\n\n".join(
+                f"**{idx}.** {record.reason}\n"
+                f"   Moderator: {mods[record.moderator_id]} | "
+                f"Date: {record.created_at}"
+                for idx, record in enumerate(records, start=1)
+            ),
         )
-        embed.set_footer(text=f"Total: {len(records)} warning(s)")
+        embed.set_footer(text=f"Total: {count} warning(s)")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -494,35 +729,15 @@ class Moderation(commands.Cog):
                 "Bot Missing Permissions",
                 f"I need the following permission(s) to do that:\n**{missing}**",
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
         # Member not found (wrapped in CommandInvokeError)
-        original = getattr(error, "original", error)
-        if isinstance(original, discord.NotFound):
-            embed = error_embed(
-                "Member Not Found",
-                "I couldn't find that member in this server.",
-            )
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
+        elif isinstance(getattr(error, "original", error), discord.NotFound):
+            embed = clone_embed(_ERR_MEMBER_NOT_FOUND)
         # Unknown -- log and surface a generic message
-        log.exception("Unhandled error in moderation cog", exc_info=error)
-        embed = error_embed(
-            "Unexpected Error",
-            "Something went wrong. Please try again later.",
-        )
-        if interaction.response.is_done():
-            await interaction.followup.send(embed=embed, ephemeral=True)
         else:
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            log.exception("Unhandled error in moderation cog", exc_info=error)
+            embed = clone_embed(_GENERIC_ERROR_EMBED)
+
+        await self._reply(interaction, embed)
 
     # ==================================================================
     # Auto-moderation listener
@@ -535,23 +750,28 @@ class Moderation(commands.Cog):
         if message.author.bot or message.guild is None:
             return
 
+        # Nothing to check when both auto-mod features are off
+        if self._word_filter_re is None and not self._spam_enabled:
+            return
+
         # Ignore members with moderation permissions (moderators are exempt)
         assert isinstance(message.author, discord.Member)
-        perms = message.author.guild_permissions
-        if perms.manage_messages or perms.kick_members or perms.ban_members:
+        if message.author.guild_permissions.value & MODERATOR_MASK:
             return
 
+        # Casefolded once and shared by both checks
+        folded = message.content.casefold()
+
         # --- Word filter --------------------------------------------------
-        word_filter: list[str] = self._config.get("word_filter", [])
-        if word_filter:
-            content_lower = message.content.lower()
-            for word in word_filter:
-                if word.lower() in content_lower:
-                    await self._handle_word_filter(message, word)
-                    return  # one action per message is enough
+        if self._word_filter_re is not None:
+            match = self._word_filter_re.search(folded)
+            if match is not None:
+                await self._handle_word_filter(message, match.group(0))
+                return  # one action per message is enough
 
         # --- Spam detection -----------------------------------------------
-        await self._handle_spam_detection(message)
+        if self._spam_enabled:
+            await self._handle_spam_detection(message, folded)
 
     # ------------------------------------------------------------------
     # Auto-mod helpers
@@ -584,28 +804,58 @@ class Moderation(commands.Cog):
         # Auto-delete the warning after 5 seconds
         await warn_msg.delete(delay=5)
 
-    async def _handle_spam_detection(self, message: discord.Message) -> None:
-        """Track message frequency and timeout spammers."""
+    @tasks.loop(seconds=10)
+    async def _sweep_spam_tracker(self) -> None:
+        """Drop tracked members whose messages have all left the spam window.
+
+        Runs in the background so quiet members don't keep their records
+        until LRU eviction reaches them.
+        """
+        cutoff = time.monotonic() - self._spam_interval
+        for key, record in list(self._spam_tracker.items()):
+            record.prune(cutoff)
+            if not record.messages:
+                del self._spam_tracker[key]
+
+    async def _handle_spam_detection(
+        self,
+        message: discord.Message,
+        folded: str,
+    ) -> None:
+        """Track message frequency and timeout spammers.
+
+        *folded* is the casefolded message content, so messages that differ
+        only in case count as identical.
+        """
         assert message.guild is not None
         assert isinstance(message.author, discord.Member)
 
-        threshold: int = self._config.get("spam_threshold", 5)
-        interval: int = self._config.get("spam_interval", 10)
+        threshold = self._spam_threshold
 
         key = (message.guild.id, message.author.id)
         now = time.monotonic()
-        record = self._spam_tracker[key]
-        record.prune(now - interval)
-        record.add(message.content, now)
+        record = self._spam_tracker.get(key)
+        if record is None:
+            record = self._spam_tracker[key] = _MessageRecord(self._spam_history)
+            if len(self._spam_tracker) > _MAX_TRACKED_MEMBERS:
+                self._spam_tracker.popitem(last=False)
+        else:
+            self._spam_tracker.move_to_end(key)
+        record.prune(now - self._spam_interval)
+        identical = record.add(
+            _content_digest(folded), now, message.channel.id, message.id
+        )
 
-        if record.identical_count(message.content) >= threshold:
-            # Purge the spam from the channel (best-effort)
+        if identical >= threshold:
+            # Bulk-delete the tracked spam from the channel (best-effort);
+            # Discord accepts at most 100 messages per bulk delete.
+            spam = [
+                discord.Object(id=message_id)
+                for message_id in record.message_ids(message.channel.id)[-100:]
+            ]
             try:
-                await message.channel.purge(  # type: ignore[union-attr]
-                    limit=threshold + 5,
-                    check=lambda m: m.author.id == message.author.id,
-                )
-            except discord.Forbidden:
+                await message.channel.delete_messages(spam)  # type: ignore[union-attr]
+            except discord.HTTPException:
                 pass
 
             # Timeout the user for 5 minutes
@@ -633,8 +883,10 @@ class Moderation(commands.Cog):
             )
             await warn_msg.delete(delay=5)
 
-            # Reset the tracker for this user
-            del self._spam_tracker[key]
+            # Reset the tracker for this user.  The record may already be
+            # gone: evicted or swept during the awaits above, or reset by a
+            # concurrent message from the same author.
+            self._spam_tracker.pop(key, None)
 
 
 # ---------------------------------------------------------------------------
@@ -7,14 +7,24 @@ reactions on tracked messages.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import re
+import time
+from collections import OrderedDict
 
+import aiosqlite
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.utils.database import add_role_menu, delete_role_menu, get_role_menu_by_message
+from bot.utils.database import (
+    add_role_menus,
+    delete_role_menu,
+    get_role_menu_by_message,
+    get_role_menu_message_ids,
+)
 from bot.utils.embeds import error_embed, info_embed, success_embed
 from bot.utils.permissions import is_admin, on_permission_error
 
@@ -28,12 +38,19 @@ log = logging.getLogger(__name__)
 # The emoji token can be:
 #   - A unicode emoji (one or more non-whitespace, non-< characters)
 #   - A custom Discord emoji (<:name:id> or <a:name:id>)
+# A token that isn't followed by a role mention is consumed whole by the
+# trailing alternative (yielding empty groups), so the engine never retries
+# from inside it -- scanning stays linear on long junk input.
 _PAIR_RE = re.compile(
-    r"(<a?:\w+:\d+>|[^\s<]+)"  # emoji (custom or unicode)
-    r"\s+"                      # whitespace separator
-    r"<@&(\d+)>",              # role mention -> captures role ID
+    r"(<a?:\w+:\d+>|[^\s<]++)"  # emoji (custom or unicode)
+    r"\s++"                      # whitespace separator
+    r"<@&(\d+)>"                 # role mention -> captures role ID
+    r"|[^\s<]++",                # or: skip a token with no role mention
 )
 
+# Bound once so each parse skips the attribute lookup on the pattern
+_PAIR_FINDALL = _PAIR_RE.findall
+
 
 def _parse_mappings(text: str) -> list[tuple[str, int]]:
     """Parse a mappings string into ``(emoji, role_id)`` pairs.
@@ -47,7 +64,18 @@ def _parse_mappings(text: str) -> list[tuple[str, int]]:
 
     Returns an empty list if nothing could be parsed.
     """
-    return [(emoji, int(role_id)) for emoji, role_id in _PAIR_RE.findall(text)]
+    return [
+        (emoji, int(role_id))
+        for emoji, role_id in _PAIR_FINDALL(text)
+        if role_id
+    ]
+
+
+# Role-menu cache: at most _MENU_CACHE_SIZE messages (LRU eviction).  Menus
+# are cached until this cog changes them; messages that aren't menus are only
+# remembered for _MENU_MISS_TTL seconds.
+_MENU_CACHE_SIZE = 4096
+_MENU_MISS_TTL = 300
 
 
 def _emoji_key(emoji: discord.PartialEmoji | str) -> str:
@@ -76,6 +104,25 @@ class Roles(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+        # {message_id: (expires_at, {emoji: role_id})}, least recently used first
+        self._menu_cache: OrderedDict[int, tuple[float, dict[str, int]]] = OrderedDict()
+
+        # IDs of every role-menu message, so reactions anywhere else are
+        # rejected with one set lookup.  Filled in ``cog_load``.
+        self._menu_message_ids: set[int] = set()
+
+        # The bot's own user ID, captured on the first reaction event since
+        # ``bot.user`` is not set until login
+        self._bot_user_id: int | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def cog_load(self) -> None:
+        """Load the IDs of existing role-menu messages."""
+        self._menu_message_ids = await get_role_menu_message_ids()
+
     # ==================================================================
     # Slash commands
     # ==================================================================
@@ -117,14 +164,11 @@ class Roles(commands.Cog):
             )
             return
 
-        # Build the description listing each emoji -> role
-        lines: list[str] = []
-        for emoji, role_id in pairs:
-            role = interaction.guild.get_role(role_id)
-            role_display = role.mention if role else f"<@&{role_id}>"
-            lines.append(f"{emoji}  {role_display}")
-
-        description = "React to assign yourself a role!\n\n" + "\n".join(lines)
+        # Build the description listing each emoji -> role.  ``Role.mention``
+        # is just ``<@&id>``, so the mention is formatted without a lookup.
+        description = "React to assign yourself a role!\n\n" + "\n".join(
+            f"{emoji}  <@&{role_id}>" for emoji, role_id in pairs
+        )
 
         embed = info_embed(title=title, description=description)
 
@@ -135,22 +179,51 @@ class Roles(commands.Cog):
         assert isinstance(interaction.channel, discord.abc.Messageable)
         menu_message = await interaction.channel.send(embed=embed)
 
-        # Add each emoji as a reaction
-        for emoji, _ in pairs:
+        # Add the reactions while every mapping is persisted to the database.
+        # Failed reactions are only logged; if saving fails, the pending
+        # reactions are cancelled since the menu would not work anyway.
+        saved = True
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    self._add_reactions(menu_message, [emoji for emoji, _ in pairs])
+                )
+                tg.create_task(
+                    add_role_menus(
+                        guild_id=interaction.guild.id,
+                        channel_id=menu_message.channel.id,
+                        message_id=menu_message.id,
+                        pairs=pairs,
+                    )
+                )
+        except* aiosqlite.Error as eg:
+            log.error(
+                "Failed to save role menu %s in guild %s",
+                menu_message.id,
+                interaction.guild.id,
+                exc_info=eg,
+            )
+            saved = False
+
+        if not saved:
+            # Without stored mappings the menu can't assign roles; remove it
             try:
-                await menu_message.add_reaction(emoji)
+                await menu_message.delete()
             except discord.HTTPException:
-                log.warning("Failed to add reaction %s to message %s", emoji, menu_message.id)
-
-        # Persist every mapping to the database
-        for emoji, role_id in pairs:
-            await add_role_menu(
-                guild_id=interaction.guild.id,
-                channel_id=menu_message.channel.id,
-                message_id=menu_message.id,
-                emoji=emoji,
-                role_id=role_id,
+                log.warning("Failed to delete unsaved role menu %s", menu_message.id)
+            await interaction.followup.send(
+                embed=error_embed(
+                    "Role Menu Not Saved",
+                    "The role menu could not be saved, so it was removed. "
+                    "Please try again later.",
+                ),
+                ephemeral=True,
             )
+            return
+
+        # A reaction may have cached a miss before the mappings were saved
+        self._menu_cache.pop(menu_message.id, None)
+        self._menu_message_ids.add(menu_message.id)
 
         await interaction.followup.send(
             embed=success_embed(
@@ -164,6 +237,19 @@ class Roles(commands.Cog):
             ephemeral=True,
         )
 
+    @staticmethod
+    async def _add_reactions(message: discord.Message, emojis: list[str]) -> None:
+        """Add *emojis* to *message* in order, logging any that fail.
+
+        Kept sequential: reactions display in the order they were added, and
+        Discord rate-limits them per message anyway.
+        """
+        for emoji in emojis:
+            try:
+                await message.add_reaction(emoji)
+            except discord.HTTPException:
+                log.warning("Failed to add reaction %s to message %s", emoji, message.id)
+
     # --- /delrolemenu -------------------------------------------------
 
     @app_commands.command(
@@ -203,6 +289,8 @@ class Roles(commands.Cog):
             return
 
         await delete_role_menu(msg_id)
+        self._menu_cache.pop(msg_id, None)
+        self._menu_message_ids.discard(msg_id)
 
         await interaction.response.send_message(
             embed=success_embed(
@@ -230,6 +318,30 @@ class Roles(commands.Cog):
     # Shared handler
     # ------------------------------------------------------------------
 
+    async def _get_menu(self, message_id: int) -> dict[str, int]:
+        """Return the ``{emoji: role_id}`` mapping for a role-menu message.
+
+        The mapping is empty if *message_id* is not a role menu.  Results,
+        including misses, are served from an in-memory cache so most
+        reaction events never touch the database.
+        """
+        entry = self._menu_cache.get(message_id)
+        now = time.monotonic()
+        if entry is not None:
+            expires_at, menu = entry
+            if now < expires_at:
+                self._menu_cache.move_to_end(message_id)
+                return menu
+            del self._menu_cache[message_id]
+
+        mappings = await get_role_menu_by_message(message_id)
+        menu = dict(mappings)
+        expires_at = math.inf if menu else now + _MENU_MISS_TTL
+        self._menu_cache[message_id] = (expires_at, menu)
+        if len(self._menu_cache) > _MENU_CACHE_SIZE:
+            self._menu_cache.popitem(last=False)
+        return menu
+
     async def _handle_reaction(
         self,
         payload: discord.RawReactionActionEvent,
@@ -238,29 +350,23 @@ class Roles(commands.Cog):
     ) -> None:
         """Process a reaction add/remove event against the role-menu database."""
 
-        # Ignore bot reactions
-        if payload.user_id == self.bot.user.id:  # type: ignore[union-attr]
+        # Ignore reactions on messages that aren't role menus
+        if payload.message_id not in self._menu_message_ids:
             return
 
-        # Ignore DMs
-        if payload.guild_id is None:
+        # Ignore bot reactions and DMs
+        if self._bot_user_id is None and self.bot.user is not None:
+            self._bot_user_id = self.bot.user.id
+        if payload.user_id == self._bot_user_id or payload.guild_id is None:
             return
 
         # Look up role-menu mappings for this message
-        mappings = await get_role_menu_by_message(payload.message_id)
-        if not mappings:
+        menu = await self._get_menu(payload.message_id)
+        if not menu:
             return
 
-        # Determine the emoji key to compare against DB entries
-        key = _emoji_key(payload.emoji)
-
-        # Find the matching role_id
-        role_id: int | None = None
-        for mapping in mappings:
-            if mapping["emoji"] == key:
-                role_id = mapping["role_id"]
-                break
-
+        # Find the role mapped to this emoji
+        role_id = menu.get(_emoji_key(payload.emoji))
         if role_id is None:
             return
 
@@ -270,10 +376,12 @@ class Roles(commands.Cog):
             return
 
         # For reaction remove events the member is not included in the
-        # payload, so we must fetch it ourselves.
-        if add and payload.member is not None:
-            member = payload.member
-        else:
+        # payload.  The member cache (filled thanks to the members intent)
+        # usually has it; only fall back to an API fetch on a cache miss.
+        member = payload.member if add else None
+        if member is None:
+            member = guild.get_member(payload.user_id)
+        if member is None:
             try:
                 member = await guild.fetch_member(payload.user_id)
             except discord.NotFound:
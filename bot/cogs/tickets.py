@@ -8,12 +8,13 @@ tickets and sending ticket panels.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 import re
 from typing import Any
 
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
@@ -28,21 +29,151 @@ log = logging.getLogger(__name__)
 # Helpers
 # ---------------------------------------------------------------------------
 
-_UNSAFE_CHANNEL_CHARS = re.compile(r"[^a-z0-9-]")
+# Runs of anything but lowercase letters and digits (existing hyphens
+# included), so one substitution both replaces and collapses them.
+_UNSAFE_CHANNEL_RUNS = re.compile(r"[^a-z0-9]+")
 
 
 def _sanitize_channel_name(name: str) -> str:
     """Convert a username into a valid Discord channel name fragment."""
-    sanitized = _UNSAFE_CHANNEL_CHARS.sub("-", name.lower())
-    # Collapse multiple consecutive hyphens and strip leading/trailing ones
-    sanitized = re.sub(r"-{2,}", "-", sanitized).strip("-")
+    sanitized = _UNSAFE_CHANNEL_RUNS.sub("-", name.lower()).strip("-")
     return sanitized or "unknown"
 
 
+# Last parsed config, keyed by (path, mtime_ns) of the file it came from
+_config_cache: tuple[tuple[str, int], dict[str, Any]] | None = None
+
+
 def _load_config() -> dict[str, Any]:
-    """Read the JSON configuration file from disk."""
-    with open(config.CONFIG_PATH, encoding="utf-8") as fp:
-        return json.load(fp)
+    """Return the JSON configuration, re-reading it only when the file changes."""
+    global _config_cache
+    path = config.CONFIG_PATH
+    stamp = (path, os.stat(path).st_mtime_ns)
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
+    with open(path, "rb") as fp:
+        data: dict[str, Any] = orjson.loads(fp.read())
+    _config_cache = (stamp, data)
+    return data
+
+
+async def _load_config_async() -> dict[str, Any]:
+    """Like :func:`_load_config`, but re-reads the file in a worker thread.
+
+    A warm cache is served inline; only an actual reload hops threads, so
+    the event loop never blocks on file I/O.
+    """
+    path = config.CONFIG_PATH
+    cached = _config_cache
+    if cached is not None and cached[0] == (path, os.stat(path).st_mtime_ns):
+        return cached[1]
+    return await asyncio.to_thread(_load_config)
+
+
+# Ticket channel overwrites.  They never vary between tickets and are only
+# read by ``create_text_channel``, so one instance of each is shared.
+_HIDDEN_OVERWRITE = discord.PermissionOverwrite(read_messages=False)
+_OPENER_OVERWRITE = discord.PermissionOverwrite(
+    read_messages=True,
+    send_messages=True,
+    attach_files=True,
+    embed_links=True,
+)
+_BOT_OVERWRITE = discord.PermissionOverwrite(
+    read_messages=True,
+    send_messages=True,
+    manage_channels=True,
+)
+_MODERATOR_OVERWRITE = discord.PermissionOverwrite(
+    read_messages=True,
+    send_messages=True,
+)
+
+
+# Moderator role IDs per guild: {guild_id: [role_id, ...]}.  Dropped by the
+# cog's role listeners whenever a guild's roles change.
+_mod_role_cache: dict[int, list[int]] = {}
+
+
+def _moderator_roles(guild: discord.Guild) -> list[discord.Role]:
+    """Return the non-default roles in *guild* with Manage Messages."""
+    role_ids = _mod_role_cache.get(guild.id)
+    if role_ids is None:
+        role_ids = _mod_role_cache[guild.id] = [
+            role.id
+            for role in guild.roles
+            if role.permissions.manage_messages and not role.is_default()
+        ]
+    return [role for role in map(guild.get_role, role_ids) if role is not None]
+
+
+# Resolved ticket category per guild: {guild_id: category_id}.  Entries are
+# re-validated on every hit, so renamed or deleted categories fall through
+# to a fresh lookup by name.
+_category_cache: dict[int, int] = {}
+
+
+def _ticket_category(
+    guild: discord.Guild, name: str
+) -> discord.CategoryChannel | None:
+    """Return the category called *name* in *guild*, if there is one."""
+    category_id = _category_cache.get(guild.id)
+    if category_id is not None:
+        category = guild.get_channel(category_id)
+        if isinstance(category, discord.CategoryChannel) and category.name == name:
+            return category
+
+    category = discord.utils.get(guild.categories, name=name)
+    if category is not None:
+        _category_cache[guild.id] = category.id
+    return category
+
+
+# Countdown-and-delete tasks still running (referenced so they aren't GC'd)
+_pending_deletes: set[asyncio.Task[None]] = set()
+
+
+async def _delete_ticket_channel(channel: discord.TextChannel) -> None:
+    """Wait out the closing countdown, then delete the ticket *channel*.
+
+    The ticket is only marked closed once the channel is gone, so a failed
+    delete leaves the record open rather than orphaning a live channel.
+    """
+    await asyncio.sleep(5)
+
+    try:
+        await channel.delete(reason="Ticket closed")
+    except discord.NotFound:
+        # Already deleted by someone else; still close the record
+        await close_ticket(channel.id)
+        return
+    except discord.Forbidden:
+        log.warning(
+            "Missing permissions to delete ticket channel %s in guild %s",
+            channel,
+            channel.guild.name,
+        )
+    except discord.HTTPException as exc:
+        log.error(
+            "Failed to delete ticket channel %s: %s",
+            channel,
+            exc,
+        )
+    else:
+        await close_ticket(channel.id)
+        return
+
+    # The opener was told the channel is closing; say that it isn't
+    try:
+        await channel.send(
+            embed=error_embed(
+                "Could Not Close Ticket",
+                "I couldn't delete this channel. A moderator will need to "
+                "delete it manually.",
+            ),
+        )
+    except discord.HTTPException:
+        log.warning("Could not report failed delete in ticket channel %s", channel)
 
 
 # ---------------------------------------------------------------------------
@@ -100,9 +231,6 @@ class TicketControlView(discord.ui.View):
         assert interaction.guild is not None
         assert interaction.channel is not None
 
-        # Mark the ticket as closed in the database
-        await close_ticket(interaction.channel.id)
-
         await interaction.response.send_message(
             embed=info_embed(
                 "Ticket Closing",
@@ -110,24 +238,18 @@ class TicketControlView(discord.ui.View):
             ),
         )
 
-        await asyncio.sleep(5)
-
-        # Delete the channel (the ticket itself)
-        try:
-            assert isinstance(interaction.channel, discord.TextChannel)
-            await interaction.channel.delete(reason="Ticket closed")
-        except discord.Forbidden:
-            log.warning(
-                "Missing permissions to delete ticket channel %s in guild %s",
-                interaction.channel,
-                interaction.guild.name,
-            )
-        except discord.HTTPException as exc:
-            log.error(
-                "Failed to delete ticket channel %s: %s",
-                interaction.channel,
-                exc,
-            )
+        # Delete the channel and close the ticket record in the background
+        # so the handler returns now
+        assert isinstance(interaction.channel, discord.TextChannel)
+        task = asyncio.create_task(_delete_ticket_channel(interaction.channel))
+        _pending_deletes.add(task)
+        task.add_done_callback(_pending_deletes.discard)
+
+
+# Both views are stateless, so one instance of each is shared by every
+# message.  discord.py >= 2.4 can construct views outside a running loop.
+_panel_view = TicketPanelView()
+_control_view = TicketControlView()
 
 
 # ---------------------------------------------------------------------------
@@ -151,16 +273,16 @@ async def _handle_ticket_creation(interaction: discord.Interaction) -> None:
             embed=error_embed(
                 "Ticket Already Open",
                 "You already have an open ticket. Please use your existing "
-                f"ticket (<#{existing['channel_id']}>) or close it first.",
+                f"ticket (<#{existing.channel_id}>) or close it first.",
             ),
             ephemeral=True,
         )
         return
 
     # --- Locate the ticket category ---------------------------------------
-    cfg = _load_config()
+    cfg = await _load_config_async()
     category_name: str = cfg.get("ticket_category", "Support Tickets")
-    category = discord.utils.get(interaction.guild.categories, name=category_name)
+    category = _ticket_category(interaction.guild, category_name)
 
     if category is None:
         log.warning(
@@ -181,32 +303,17 @@ async def _handle_ticket_creation(interaction: discord.Interaction) -> None:
 
     # --- Build permission overwrites --------------------------------------
     overwrites: dict[discord.Role | discord.Member, discord.PermissionOverwrite] = {
-        interaction.guild.default_role: discord.PermissionOverwrite(
-            read_messages=False,
-        ),
-        interaction.user: discord.PermissionOverwrite(
-            read_messages=True,
-            send_messages=True,
-            attach_files=True,
-            embed_links=True,
-        ),
+        interaction.guild.default_role: _HIDDEN_OVERWRITE,
+        interaction.user: _OPENER_OVERWRITE,
     }
 
     # Allow the bot itself to manage the channel
     if interaction.guild.me is not None:
-        overwrites[interaction.guild.me] = discord.PermissionOverwrite(
-            read_messages=True,
-            send_messages=True,
-            manage_channels=True,
-        )
+        overwrites[interaction.guild.me] = _BOT_OVERWRITE
 
     # Grant access to moderators (members with Manage Messages permission)
-    for role in interaction.guild.roles:
-        if role.permissions.manage_messages and not role.is_default():
-            overwrites[role] = discord.PermissionOverwrite(
-                read_messages=True,
-                send_messages=True,
-            )
+    for role in _moderator_roles(interaction.guild):
+        overwrites[role] = _MODERATOR_OVERWRITE
 
     # --- Create the channel -----------------------------------------------
     channel_name = f"ticket-{_sanitize_channel_name(interaction.user.name)}"
@@ -262,7 +369,7 @@ async def _handle_ticket_creation(interaction: discord.Interaction) -> None:
     )
     ticket_embed.set_footer(text=f"Ticket for {interaction.user} ({interaction.user.id})")
 
-    await channel.send(embed=ticket_embed, view=TicketControlView())
+    await channel.send(embed=ticket_embed, view=_control_view)
 
     # --- Confirm to the user (ephemeral) -----------------------------------
     await interaction.response.send_message(
@@ -291,8 +398,24 @@ class Tickets(commands.Cog):
 
     async def cog_load(self) -> None:
         """Register persistent views so they survive bot restarts."""
-        self.bot.add_view(TicketPanelView())
-        self.bot.add_view(TicketControlView())
+        self.bot.add_view(_panel_view)
+        self.bot.add_view(_control_view)
+
+    # ------------------------------------------------------------------
+    # Moderator-role cache invalidation
+    # ------------------------------------------------------------------
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        _mod_role_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        _mod_role_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        _mod_role_cache.pop(role.guild.id, None)
 
     # ==================================================================
     # Slash commands
@@ -340,7 +463,7 @@ class Tickets(commands.Cog):
         )
         panel_embed.set_footer(text="Click the button below to get started")
 
-        await interaction.channel.send(embed=panel_embed, view=TicketPanelView())  # type: ignore[union-attr]
+        await interaction.channel.send(embed=panel_embed, view=_panel_view)  # type: ignore[union-attr]
 
     # ==================================================================
     # Error handler
@@ -6,6 +6,7 @@ Provides general-purpose slash commands available to all members.
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 
 import discord
 from discord import app_commands
@@ -16,10 +17,20 @@ from bot.utils.embeds import error_embed, info_embed
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Poll reaction emojis
+# Polls
 # ---------------------------------------------------------------------------
 
-_NUMBER_EMOJIS: list[str] = [
+# How long a native Discord poll stays open
+_POLL_DURATION = timedelta(hours=24)
+
+# Discord's length limits for native poll questions and answers; longer
+# text falls back to an embed poll
+_POLL_QUESTION_MAX = 300
+_POLL_ANSWER_MAX = 55
+
+# Reactions for embed polls
+
+_NUMBER_EMOJIS: tuple[str, ...] = (
     "1\N{COMBINING ENCLOSING KEYCAP}",
     "2\N{COMBINING ENCLOSING KEYCAP}",
     "3\N{COMBINING ENCLOSING KEYCAP}",
@@ -29,7 +40,7 @@ _NUMBER_EMOJIS: list[str] = [
     "7\N{COMBINING ENCLOSING KEYCAP}",
     "8\N{COMBINING ENCLOSING KEYCAP}",
     "9\N{COMBINING ENCLOSING KEYCAP}",
-]
+)
 
 
 # ---------------------------------------------------------------------------
@@ -60,12 +71,14 @@ class Utility(commands.Cog):
 
         embed = info_embed(title=guild.name)
 
-        if guild.icon:
-            embed.set_thumbnail(url=guild.icon.url)
+        icon = guild.icon
+        if icon:
+            embed.set_thumbnail(url=icon.url)
 
+        owner = guild.owner
         embed.add_field(
             name="Owner",
-            value=guild.owner.mention if guild.owner else "Unknown",
+            value=owner.mention if owner else "Unknown",
             inline=True,
         )
         embed.add_field(
@@ -79,15 +92,16 @@ class Utility(commands.Cog):
             inline=True,
         )
 
-        # Online count -- requires the members to be cached (presences intent)
-        online_count = sum(
-            1
-            for m in guild.members
-            if m.status != discord.Status.offline and not m.bot
-        )
+        # Online and bot counts in one pass over the member cache.  The
+        # online count requires the presences intent.
+        offline = discord.Status.offline
+        online_count = bot_count = 0
+        for m in guild.members:
+            if m.bot:
+                bot_count += 1
+            elif m.status is not offline:
+                online_count += 1
         embed.add_field(name="Online", value=str(online_count), inline=True)
-
-        bot_count = sum(1 for m in guild.members if m.bot)
         embed.add_field(name="Bots", value=str(bot_count), inline=True)
 
         embed.add_field(
@@ -137,54 +151,50 @@ class Utility(commands.Cog):
         member = user or interaction.user
         assert isinstance(member, discord.Member)
 
+        # ``top_role`` scans the member's roles on every access, so read it once
+        top_role = member.top_role
+
         # Use the member's top role colour, falling back to the default embed colour
-        color = (
-            member.top_role.color
-            if member.top_role.color != discord.Color.default()
-            else discord.Color.blue()
-        )
+        color = top_role.color
+        if color == discord.Color.default():
+            color = discord.Color.blue()
 
         embed = info_embed(title=member.display_name)
         embed.color = color
 
-        if member.avatar:
-            embed.set_thumbnail(url=member.avatar.url)
-        elif member.default_avatar:
-            embed.set_thumbnail(url=member.default_avatar.url)
+        embed.set_thumbnail(url=member.display_avatar.url)
+
+        # Username (flagged for bots) and ID go in the author line and footer
+        # rather than in fields, keeping the embed small
+        embed.set_author(
+            name=f"{member.name} \N{ROBOT FACE}" if member.bot else member.name
+        )
+        embed.set_footer(text=f"User ID: {member.id}")
 
-        embed.add_field(name="Username", value=member.name, inline=True)
-        embed.add_field(name="ID", value=str(member.id), inline=True)
         embed.add_field(
             name="Account Created",
             value=f"<t:{int(member.created_at.timestamp())}:R>",
             inline=True,
         )
 
-        if member.joined_at:
-            joined_value = f"<t:{int(member.joined_at.timestamp())}:R>"
+        joined_at = member.joined_at
+        if joined_at:
+            joined_value = f"<t:{int(joined_at.timestamp())}:R>"
         else:
             joined_value = "Unknown"
         embed.add_field(name="Joined Server", value=joined_value, inline=True)
 
         embed.add_field(
             name="Top Role",
-            value=member.top_role.mention,
+            value=top_role.mention,
             inline=True,
         )
 
-        # List roles excluding @everyone
-        roles = [r.mention for r in member.roles if r != interaction.guild.default_role]
-        embed.add_field(
-            name="Roles",
-            value=" ".join(roles) if roles else "None",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="Bot",
-            value="Yes" if member.bot else "No",
-            inline=True,
-        )
+        # List roles excluding @everyone (the guild's own instance, so an
+        # identity check suffices)
+        default_role = interaction.guild.default_role
+        roles = " ".join(r.mention for r in member.roles if r is not default_role)
+        embed.add_field(name="Roles", value=roles or "None", inline=False)
 
         await interaction.response.send_message(embed=embed)
 
@@ -239,23 +249,42 @@ class Utility(commands.Cog):
             )
             return
 
-        # Build the description with numbered emoji lines
-        description_lines: list[str] = []
-        for idx, option in enumerate(options):
-            description_lines.append(f"{_NUMBER_EMOJIS[idx]} {option}")
+        # A native poll carries the options in the message itself, so the
+        # whole poll is a single request
+        if len(question) <= _POLL_QUESTION_MAX and all(
+            len(option) <= _POLL_ANSWER_MAX for option in options
+        ):
+            native_poll = discord.Poll(question=question, duration=_POLL_DURATION)
+            for option in options:
+                native_poll.add_answer(text=option)
+            await interaction.response.send_message(poll=native_poll)
+            return
 
+        # Otherwise build an embed poll with numbered emoji lines
         embed = info_embed(
             title=f"\U0001f4ca {question}",
-            description="\n\n".join(description_lines),
+            description="\n\n".join(
+                f"{emoji} {option}" for emoji, option in zip(_NUMBER_EMOJIS, options)
+            ),
         )
         embed.set_footer(text=f"Poll by {interaction.user.display_name}")
 
         await interaction.response.send_message(embed=embed)
 
-        # Fetch the sent message so we can add reactions
+        # Fetch the sent message so we can add reactions.  Kept sequential:
+        # reactions display in the order they were added, and Discord
+        # rate-limits them per message anyway.  A failed reaction is logged
+        # rather than aborting the rest.
         message = await interaction.original_response()
         for idx in range(len(options)):
-            await message.add_reaction(_NUMBER_EMOJIS[idx])
+            try:
+                await message.add_reaction(_NUMBER_EMOJIS[idx])
+            except discord.HTTPException:
+                log.warning(
+                    "Failed to add reaction %s to poll %s",
+                    _NUMBER_EMOJIS[idx],
+                    message.id,
+                )
 
     # ==================================================================
     # Error handler
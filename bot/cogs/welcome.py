@@ -6,11 +6,16 @@ admin-only slash commands to configure the welcome channel and auto-role.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import logging
+import os
+import tempfile
+import time
 from typing import Any
 
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
@@ -21,6 +26,61 @@ from bot.utils.permissions import is_admin, on_permission_error
 log = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Config file I/O (blocking; the cog runs it in a worker thread)
+# ---------------------------------------------------------------------------
+
+# Last parsed config, keyed by (path, mtime_ns) of the file it came from.
+# Join/leave events read it without touching the file unless it changed.
+_config_cache: tuple[tuple[str, int], dict[str, Any]] | None = None
+
+
+def _read_config() -> dict[str, Any]:
+    """Return the JSON configuration, re-reading it only when the file changes."""
+    global _config_cache
+    path = config.CONFIG_PATH
+    stamp = (path, os.stat(path).st_mtime_ns)
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
+    with open(path, "rb") as fp:
+        data: dict[str, Any] = orjson.loads(fp.read())
+    _config_cache = (stamp, data)
+    return data
+
+
+# Matches the indented, newline-terminated layout of the shipped config
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+
+def _write_config(data: dict[str, Any]) -> None:
+    """Write *data* to the JSON configuration file and cache it.
+
+    The data goes to a temporary file that then replaces the config, so
+    readers never see a half-written file.
+    """
+    global _config_cache
+    path = config.CONFIG_PATH
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".config-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(orjson.dumps(data, option=_DUMP_OPTIONS))
+        # mkstemp creates the file owner-only; keep the config's own mode
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _config_cache = ((path, os.stat(path).st_mtime_ns), data)
+
+
+# Misconfiguration messages (missing channel/role/permissions) repeat on
+# every join and leave; each is logged at most once per guild per interval
+_LOG_THROTTLE_SECONDS = 60.0
+
+
 # ---------------------------------------------------------------------------
 # Cog
 # ---------------------------------------------------------------------------
@@ -32,37 +92,196 @@ class Welcome(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+        # Per-guild name indexes:  {guild_id: {name: channel/role}}.  Built
+        # on first use and dropped whenever a channel or role in that guild
+        # is created, edited or deleted.
+        self._channels_by_name: dict[int, dict[str, discord.TextChannel]] = {}
+        self._roles_by_name: dict[int, dict[str, discord.Role]] = {}
+
+        # Last time each throttled message was logged:  {(guild_id, kind): t}
+        self._last_logged: dict[tuple[int, str], float] = {}
+
+        # Serialises read-modify-write updates of config.json
+        self._config_lock = asyncio.Lock()
+
+        self._migration_task: asyncio.Task[None] | None = None
+
+    async def cog_load(self) -> None:
+        """Schedule the one-off name-to-ID config migration."""
+        self._migration_task = asyncio.create_task(self._migrate_after_ready())
+
+    async def cog_unload(self) -> None:
+        if self._migration_task is not None:
+            self._migration_task.cancel()
+
+    # ------------------------------------------------------------------
+    # Logging helper
+    # ------------------------------------------------------------------
+
+    def _log_throttled(
+        self,
+        guild_id: int,
+        kind: str,
+        level: int,
+        msg: str,
+        *args: Any,
+    ) -> None:
+        """Log *msg* unless the same *kind* was logged for the guild recently."""
+        key = (guild_id, kind)
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is not None and now - last < _LOG_THROTTLE_SECONDS:
+            return
+        self._last_logged[key] = now
+        log.log(level, msg, *args)
+
     # ------------------------------------------------------------------
     # Config helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _load_config() -> dict[str, Any]:
-        """Load the JSON configuration file from disk."""
-        with open(config.CONFIG_PATH, encoding="utf-8") as fp:
-            return json.load(fp)
+    async def _load_config() -> dict[str, Any]:
+        """Return the JSON configuration, reading the file in a worker thread.
+
+        A warm cache is served inline, so only an actual reload leaves the
+        event loop.  The returned dict is shared; copy it before mutating.
+        """
+        path = config.CONFIG_PATH
+        cached = _config_cache
+        if cached is not None and cached[0] == (path, os.stat(path).st_mtime_ns):
+            return cached[1]
+        return await asyncio.to_thread(_read_config)
 
     @staticmethod
-    def _save_config(data: dict[str, Any]) -> None:
-        """Write *data* back to the JSON configuration file."""
-        with open(config.CONFIG_PATH, "w", encoding="utf-8") as fp:
-            json.dump(data, fp, indent=2, ensure_ascii=False)
-            fp.write("\n")
+    async def _save_config(data: dict[str, Any]) -> None:
+        """Write *data* back to the JSON configuration file in a worker thread."""
+        await asyncio.to_thread(_write_config, data)
+
+    async def _update_config(self, changes: dict[str, Any]) -> None:
+        """Merge *changes* into the config, keeping every other setting."""
+        async with self._config_lock:
+            cfg = dict(await self._load_config())
+            cfg.update(changes)
+            await self._save_config(cfg)
+
+    async def _migrate_after_ready(self) -> None:
+        await self.bot.wait_until_ready()
+        await self._migrate_legacy_ids()
+
+    async def _migrate_legacy_ids(self) -> None:
+        """Store the IDs of a name-only welcome channel and auto-role.
+
+        Configs written before IDs were stored only name the channel and
+        role; the first guild where the name resolves supplies the ID.
+        Failures are logged and the names keep working as a fallback.
+        """
+        cfg = await self._load_config()
+        channel_name: str = cfg.get("welcome_channel", "welcome")
+        role_name: str = cfg.get("auto_role", "")
+        need_channel = "welcome_channel_id" not in cfg
+        need_role = bool(role_name) and "auto_role_id" not in cfg
+
+        changes: dict[str, Any] = {}
+        for guild in self.bot.guilds:
+            if need_channel:
+                channel = self._text_channel_named(guild, channel_name)
+                if channel is not None:
+                    changes["welcome_channel_id"] = channel.id
+                    need_channel = False
+            if need_role:
+                role = self._role_named(guild, role_name)
+                if role is not None:
+                    changes["auto_role_id"] = role.id
+                    need_role = False
+        if not changes:
+            return
+
+        try:
+            await self._update_config(changes)
+        except OSError:
+            log.exception("Could not save welcome channel/auto-role IDs to config")
+        else:
+            log.info("Saved welcome config IDs: %s", changes)
 
     # ------------------------------------------------------------------
-    # Channel lookup helper
+    # Channel / role lookup helpers
     # ------------------------------------------------------------------
 
+    def _text_channel_named(
+        self,
+        guild: discord.Guild,
+        name: str,
+    ) -> discord.TextChannel | None:
+        """Return the first text channel in *guild* called *name*."""
+        index = self._channels_by_name.get(guild.id)
+        if index is None:
+            # Reversed so the first channel wins on duplicate names, as
+            # with ``discord.utils.get``
+            index = self._channels_by_name[guild.id] = {
+                channel.name: channel for channel in reversed(guild.text_channels)
+            }
+        return index.get(name)
+
+    def _role_named(self, guild: discord.Guild, name: str) -> discord.Role | None:
+        """Return the first role in *guild* called *name*."""
+        index = self._roles_by_name.get(guild.id)
+        if index is None:
+            index = self._roles_by_name[guild.id] = {
+                role.name: role for role in reversed(guild.roles)
+            }
+        return index.get(name)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self._channels_by_name.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel,
+    ) -> None:
+        self._channels_by_name.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._channels_by_name.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        self._roles_by_name.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        self._roles_by_name.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self._roles_by_name.pop(role.guild.id, None)
+
     def _get_welcome_channel(
         self,
         guild: discord.Guild,
         cfg: dict[str, Any],
     ) -> discord.TextChannel | None:
-        """Return the welcome :class:`TextChannel`, or ``None`` if not found."""
+        """Return the welcome :class:`TextChannel`, or ``None`` if not found.
+
+        Looked up by ``welcome_channel_id`` first, falling back to the
+        channel name for configs that don't store the ID.
+        """
+        channel_id: int | None = cfg.get("welcome_channel_id")
+        if channel_id is not None:
+            channel = guild.get_channel(channel_id)
+            if isinstance(channel, discord.TextChannel):
+                return channel
+
         channel_name: str = cfg.get("welcome_channel", "welcome")
-        channel = discord.utils.get(guild.text_channels, name=channel_name)
+        channel = self._text_channel_named(guild, channel_name)
         if channel is None:
-            log.warning(
+            self._log_throttled(
+                guild.id,
+                "welcome_channel_missing",
+                logging.WARNING,
                 "Welcome channel '%s' not found in guild %s (%s)",
                 channel_name,
                 guild.name,
@@ -70,6 +289,38 @@ class Welcome(commands.Cog):
             )
         return channel
 
+    def _get_auto_role(
+        self,
+        guild: discord.Guild,
+        cfg: dict[str, Any],
+    ) -> discord.Role | None:
+        """Return the auto-role, or ``None`` if it is unset or not found.
+
+        Resolved like :meth:`_get_welcome_channel`, via ``auto_role_id``.
+        """
+        role_name: str = cfg.get("auto_role", "")
+        if not role_name:
+            return None
+
+        role_id: int | None = cfg.get("auto_role_id")
+        if role_id is not None:
+            role = guild.get_role(role_id)
+            if role is not None:
+                return role
+
+        role = self._role_named(guild, role_name)
+        if role is None:
+            self._log_throttled(
+                guild.id,
+                "auto_role_missing",
+                logging.WARNING,
+                "Auto-role '%s' not found in guild %s (%s)",
+                role_name,
+                guild.name,
+                guild.id,
+            )
+        return role
+
     # ==================================================================
     # Events
     # ==================================================================
@@ -80,7 +331,7 @@ class Welcome(commands.Cog):
     async def on_member_join(self, member: discord.Member) -> None:
         """Send a welcome embed and auto-assign a role to new members."""
         guild = member.guild
-        cfg = self._load_config()
+        cfg = await self._load_config()
 
         # -- Welcome message -------------------------------------------
         channel = self._get_welcome_channel(guild, cfg)
@@ -88,33 +339,29 @@ class Welcome(commands.Cog):
             try:
                 await channel.send(embed=welcome_embed(member))
             except discord.Forbidden:
-                log.error(
+                self._log_throttled(
+                    guild.id,
+                    "welcome_forbidden",
+                    logging.ERROR,
                     "Missing permissions to send welcome message in #%s (guild: %s)",
                     channel.name,
                     guild.id,
                 )
 
         # -- Auto-role -------------------------------------------------
-        role_name: str = cfg.get("auto_role", "")
-        if not role_name:
-            return
-
-        role = discord.utils.get(guild.roles, name=role_name)
+        role = self._get_auto_role(guild, cfg)
         if role is None:
-            log.warning(
-                "Auto-role '%s' not found in guild %s (%s)",
-                role_name,
-                guild.name,
-                guild.id,
-            )
             return
 
         try:
             await member.add_roles(role, reason="Auto-role on join")
         except discord.Forbidden:
-            log.error(
+            self._log_throttled(
+                guild.id,
+                "auto_role_forbidden",
+                logging.ERROR,
                 "Missing permissions to assign role '%s' to %s in guild %s (%s)",
-                role_name,
+                role.name,
                 member,
                 guild.name,
                 guild.id,
@@ -122,7 +369,7 @@ class Welcome(commands.Cog):
         except discord.HTTPException as exc:
             log.error(
                 "Failed to assign auto-role '%s' to %s: %s",
-                role_name,
+                role.name,
                 member,
                 exc,
             )
@@ -133,7 +380,7 @@ class Welcome(commands.Cog):
     async def on_member_remove(self, member: discord.Member) -> None:
         """Send a leave notification when a member leaves the server."""
         guild = member.guild
-        cfg = self._load_config()
+        cfg = await self._load_config()
 
         channel = self._get_welcome_channel(guild, cfg)
         if channel is None:
@@ -148,15 +395,15 @@ class Welcome(commands.Cog):
             ),
         )
 
-        if member.avatar:
-            embed.set_thumbnail(url=member.avatar.url)
-        elif member.default_avatar:
-            embed.set_thumbnail(url=member.default_avatar.url)
+        embed.set_thumbnail(url=member.display_avatar.url)
 
         try:
             await channel.send(embed=embed)
         except discord.Forbidden:
-            log.error(
+            self._log_throttled(
+                guild.id,
+                "leave_forbidden",
+                logging.ERROR,
                 "Missing permissions to send leave message in #%s (guild: %s)",
                 channel.name,
                 guild.id,
@@ -179,10 +426,10 @@ class Welcome(commands.Cog):
         interaction: discord.Interaction,
         channel: discord.TextChannel,
     ) -> None:
-        """Update the ``welcome_channel`` setting in *config.json*."""
-        cfg = self._load_config()
-        cfg["welcome_channel"] = channel.name
-        self._save_config(cfg)
+        """Update the ``welcome_channel`` settings in *config.json*."""
+        await self._update_config(
+            {"welcome_channel": channel.name, "welcome_channel_id": channel.id}
+        )
 
         await interaction.response.send_message(
             embed=success_embed(
@@ -204,10 +451,8 @@ class Welcome(commands.Cog):
         interaction: discord.Interaction,
         role: discord.Role,
     ) -> None:
-        """Update the ``auto_role`` setting in *config.json*."""
-        cfg = self._load_config()
-        cfg["auto_role"] = role.name
-        self._save_config(cfg)
+        """Update the ``auto_role`` settings in *config.json*."""
+        await self._update_config({"auto_role": role.name, "auto_role_id": role.id})
 
         await interaction.response.send_message(
             embed=success_embed(
@@ -5,6 +5,9 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Bot version (advertised in the User-Agent of outgoing HTTP requests)
+VERSION: str = "1.0.0"
+
 # Discord bot token (required)
 DISCORD_TOKEN: str = os.getenv("DISCORD_TOKEN", "")
 
@@ -1,11 +1,12 @@
 import asyncio
 import logging
 
+import aiohttp
 import discord
 from discord.ext import commands
 
 from bot import config
-from bot.utils.database import init_db
+from bot.utils.database import close_db, init_db
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -54,21 +55,48 @@ async def main() -> None:
 
     # -- Startup sequence --------------------------------------------------
 
-    async with bot:
+    # A single HTTP session (and connection pool) is shared by every cog via
+    # ``bot.http_session`` so warm TLS connections are reused across commands.
+    # Resolved hosts are cached and idle sockets are kept alive for longer
+    # than aiohttp's 15 s default, so follow-up requests skip DNS + TLS.
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=8,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    headers = {
+        "User-Agent": f"discord-bot/{config.VERSION}",
+        "Connection": "keep-alive",
+    }
+
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as http_session, bot:
+        bot.http_session = http_session  # type: ignore[attr-defined]
+
         # Initialise the database before anything else
         await init_db()
         log.info("Database initialised at %s", config.DATABASE_PATH)
 
-        # Load all cog extensions
-        for extension in INITIAL_EXTENSIONS:
-            try:
-                await bot.load_extension(extension)
+        # Load all cog extensions concurrently so their async setup (e.g.
+        # database reads in ``cog_load``) overlaps.  One failing extension
+        # does not prevent the others from loading.
+        results = await asyncio.gather(
+            *(bot.load_extension(extension) for extension in INITIAL_EXTENSIONS),
+            return_exceptions=True,
+        )
+        for extension, result in zip(INITIAL_EXTENSIONS, results):
+            if isinstance(result, BaseException):
+                log.error("Failed to load extension: %s", extension, exc_info=result)
+            else:
                 log.info("Loaded extension: %s", extension)
-            except Exception:
-                log.exception("Failed to load extension: %s", extension)
 
         # Run the bot (blocks until the bot is closed)
-        await bot.start(config.DISCORD_TOKEN)
+        try:
+            await bot.start(config.DISCORD_TOKEN)
+        finally:
+            await close_db()
 
 
 if __name__ == "__main__":
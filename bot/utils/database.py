@@ -1,33 +1,244 @@
 """Async SQLite database utilities for the Discord bot.
 
 Uses ``aiosqlite`` for non-blocking database access.  Every public helper
-opens **and closes** its own connection so callers never need to worry about
-connection lifecycle.
+borrows a connection from a small module-level pool and returns it when done,
+so callers never need to worry about connection lifecycle.  Call
+:func:`close_db` once on shutdown.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import NamedTuple
 
 import aiosqlite
 
 from bot import config
 
 # ---------------------------------------------------------------------------
-# Connection helpers
+# Row types
 # ---------------------------------------------------------------------------
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Return a new :class:`aiosqlite.Connection` to the bot database.
+class WarningRow(NamedTuple):
+    """One row of the ``warnings`` table."""
 
-    The caller is responsible for closing the connection (ideally via
-    ``async with``).
+    id: int
+    guild_id: int
+    user_id: int
+    moderator_id: int
+    reason: str
+    created_at: str
+
+
+class TicketRow(NamedTuple):
+    """One row of the ``tickets`` table."""
+
+    id: int
+    guild_id: int
+    user_id: int
+    channel_id: int
+    status: str
+    created_at: str
+
+
+class RoleMenuRow(NamedTuple):
+    """One row of the ``role_menus`` table."""
+
+    id: int
+    guild_id: int
+    channel_id: int
+    message_id: int
+    emoji: str
+    role_id: int
+
+
+class RoleMapping(NamedTuple):
+    """The emoji-to-role part of a role-menu row."""
+
+    emoji: str
+    role_id: int
+
+
+# ---------------------------------------------------------------------------
+# Statements
+# ---------------------------------------------------------------------------
+
+# Shared by every helper that runs them, so each statement has exactly one
+# spelling and hits the same entry in the connection's statement cache.
+_SQL_INSERT_WARNING = """
+INSERT INTO warnings (guild_id, user_id, moderator_id, reason)
+VALUES (?, ?, ?, ?)
+"""
+_SQL_SELECT_WARNINGS = """
+SELECT id, guild_id, user_id, moderator_id, reason, created_at
+FROM warnings
+WHERE guild_id = ? AND user_id = ?
+ORDER BY created_at DESC
+"""
+_SQL_COUNT_WARNINGS = "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?"
+
+_SQL_INSERT_TICKET = """
+INSERT INTO tickets (guild_id, user_id, channel_id)
+VALUES (?, ?, ?)
+"""
+_SQL_CLOSE_TICKET = "UPDATE tickets SET status = 'closed' WHERE channel_id = ?"
+_SQL_SELECT_OPEN_TICKET = """
+SELECT id, guild_id, user_id, channel_id, status, created_at
+FROM tickets
+WHERE guild_id = ? AND user_id = ? AND status = 'open'
+LIMIT 1
+"""
+
+_SQL_INSERT_ROLE_MENU = """
+INSERT INTO role_menus (guild_id, channel_id, message_id, emoji, role_id)
+VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_ROLE_MENUS = """
+SELECT id, guild_id, channel_id, message_id, emoji, role_id
+FROM role_menus
+WHERE guild_id = ?
+"""
+_SQL_SELECT_ROLE_MENU_BY_MESSAGE = (
+    "SELECT emoji, role_id FROM role_menus WHERE message_id = ?"
+)
+_SQL_SELECT_ROLE_MENU_MESSAGE_IDS = "SELECT DISTINCT message_id FROM role_menus"
+_SQL_DELETE_ROLE_MENU = "DELETE FROM role_menus WHERE message_id = ?"
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+# Applied to every pooled connection.  WAL lets readers run alongside the
+# writer, and with WAL ``synchronous=NORMAL`` is still crash-safe while
+# syncing far less often.  A locked database is retried for up to 30 s
+# instead of failing at once.
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=30000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA foreign_keys=ON;
+"""
+
+# Connections kept open per database.  SQLite allows only one writer at a
+# time, so a handful is enough to overlap reads without piling up threads.
+_POOL_SIZE = 4
+
+
+def _is_in_memory(path: str) -> bool:
+    """Whether *path* names an in-memory database (``:memory:`` or a URI)."""
+    return path == ":memory:" or (path.startswith("file:") and "mode=memory" in path)
+
+
+class _ConnectionPool:
+    """Long-lived connections to one database, handed out one caller at a time.
+
+    Reusing connections skips the open/close cost of every query and keeps
+    SQLite's page cache warm between calls.
     """
-    conn = await aiosqlite.connect(config.DATABASE_PATH)
-    conn.row_factory = aiosqlite.Row
-    return conn
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # Each plain ``:memory:`` connection is a separate database, and
+        # shared-cache memory databases lock per table rather than waiting
+        # on busy_timeout, so in-memory databases get a single connection.
+        self._size = 1 if _is_in_memory(path) else _POOL_SIZE
+        # ``None`` is a wake-up sentinel that close() posts for each waiter
+        self._idle: asyncio.Queue[aiosqlite.Connection | None] = asyncio.Queue()
+        self._opened = 0
+        self._waiting = 0
+        self._closed = False
+
+    async def _open(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.path, uri=self.path.startswith("file:"))
+        await conn.executescript(_PRAGMAS)
+        return conn
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out a connection, opening one if the pool isn't full yet.
+
+        Anything left uncommitted when the caller fails is rolled back, so
+        the next borrower starts outside a transaction.  Raises
+        :exc:`RuntimeError` if the pool is closed, including while waiting.
+        """
+        if self._closed:
+            raise RuntimeError(f"Database pool for {self.path!r} is closed")
+        try:
+            conn = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._opened >= self._size:
+                self._waiting += 1
+                try:
+                    conn = await self._idle.get()
+                finally:
+                    self._waiting -= 1
+                if conn is None:
+                    raise RuntimeError(
+                        f"Database pool for {self.path!r} closed while waiting"
+                    ) from None
+            else:
+                self._opened += 1
+                try:
+                    conn = await self._open()
+                except BaseException:
+                    self._opened -= 1
+                    raise
+
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                await conn.rollback()
+            raise
+        finally:
+            if self._closed:
+                await conn.close()
+            else:
+                self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close idle connections now and the rest as they are returned.
+
+        Callers still waiting for a connection are woken with an error.
+        """
+        self._closed = True
+        idle = []
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if conn is not None:
+                idle.append(conn)
+        for _ in range(self._waiting):
+            self._idle.put_nowait(None)
+        for conn in idle:
+            await conn.close()
+
+
+# Pool for the database opened by :func:`init_db`, until :func:`close_db`
+_pool: _ConnectionPool | None = None
+
+
+@asynccontextmanager
+async def _connection() -> AsyncIterator[aiosqlite.Connection]:
+    """Borrow a pooled connection to the database opened by :func:`init_db`."""
+    if _pool is None:
+        raise RuntimeError("Database is not initialised; call init_db() first")
+    async with _pool.connection() as conn:
+        yield conn
+
+
+async def close_db() -> None:
+    """Close every pooled connection.  Call once when the bot shuts down."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
 
 
 # ---------------------------------------------------------------------------
@@ -39,16 +250,19 @@ async def init_db() -> None:
     """Create the database file, parent directories, and all tables.
 
     This **must** be called once during bot startup before any other database
-    function is used.
+    function is used.  It opens the connection pool for
+    ``config.DATABASE_PATH``; to switch databases, call :func:`close_db`
+    first.
     """
+    global _pool
     # Ensure the data/ directory exists
-    db_path = Path(config.DATABASE_PATH)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if not _is_in_memory(config.DATABASE_PATH):
+        Path(config.DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
 
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
-        # Enable Write-Ahead Logging for better concurrent read performance
-        await db.execute("PRAGMA journal_mode=WAL;")
+    if _pool is None:
+        _pool = _ConnectionPool(config.DATABASE_PATH)
 
+    async with _connection() as db:
         # -- Moderation warnings -----------------------------------------------
         await db.execute(
             """
@@ -91,6 +305,28 @@ async def init_db() -> None:
             """
         )
 
+        # -- Indexes for the lookups the helpers below run ---------------------
+        # created_at is included so per-user warning lists come back in
+        # order straight from the index.
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_warnings_guild_user
+            ON warnings (guild_id, user_id, created_at);
+            """
+        )
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_tickets_guild_user_status
+            ON tickets (guild_id, user_id, status);
+            """
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_role_menus_message ON role_menus (message_id);"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_role_menus_guild ON role_menus (guild_id);"
+        )
+
         await db.commit()
 
 
@@ -106,12 +342,9 @@ async def add_warning(
     reason: str,
 ) -> int:
     """Insert a new warning and return its row id."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         cursor = await db.execute(
-            """
-            INSERT INTO warnings (guild_id, user_id, moderator_id, reason)
-            VALUES (?, ?, ?, ?)
-            """,
+            _SQL_INSERT_WARNING,
             (guild_id, user_id, moderator_id, reason),
         )
         await db.commit()
@@ -119,28 +352,60 @@ async def add_warning(
         return cursor.lastrowid
 
 
-async def get_warnings(guild_id: int, user_id: int) -> list[dict[str, Any]]:
-    """Return all warnings for a user in a guild as a list of dicts."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def add_warning_and_count(
+    guild_id: int,
+    user_id: int,
+    moderator_id: int,
+    reason: str,
+) -> int:
+    """Insert a new warning and return the user's updated warning total.
+
+    The insert and the count share one connection and transaction, so the
+    total always includes the warning just added.
+    """
+    async with _connection() as db:
+        await db.execute(
+            _SQL_INSERT_WARNING,
+            (guild_id, user_id, moderator_id, reason),
+        )
         cursor = await db.execute(
-            """
-            SELECT id, guild_id, user_id, moderator_id, reason, created_at
-            FROM warnings
-            WHERE guild_id = ? AND user_id = ?
-            ORDER BY created_at DESC
-            """,
+            _SQL_COUNT_WARNINGS,
+            (guild_id, user_id),
+        )
+        row = await cursor.fetchone()
+        await db.commit()
+        assert row is not None
+        return int(row[0])
+
+
+async def get_warnings_with_count(
+    guild_id: int, user_id: int
+) -> tuple[list[WarningRow], int]:
+    """Return a user's warnings in a guild together with their count.
+
+    Saves a second ``COUNT(*)`` round-trip when the caller renders the list
+    anyway.
+    """
+    async with _connection() as db:
+        cursor = await db.execute(
+            _SQL_SELECT_WARNINGS,
             (guild_id, user_id),
         )
         rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [WarningRow._make(row) for row in rows], len(rows)
+
+
+async def get_warnings(guild_id: int, user_id: int) -> list[WarningRow]:
+    """Return all warnings for a user in a guild, newest first."""
+    records, _ = await get_warnings_with_count(guild_id, user_id)
+    return records
 
 
 async def get_warning_count(guild_id: int, user_id: int) -> int:
     """Return the total number of warnings for a user in a guild."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         cursor = await db.execute(
-            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?",
+            _SQL_COUNT_WARNINGS,
             (guild_id, user_id),
         )
         row = await cursor.fetchone()
@@ -159,12 +424,9 @@ async def create_ticket(
     channel_id: int,
 ) -> int:
     """Create a new support ticket and return its row id."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         cursor = await db.execute(
-            """
-            INSERT INTO tickets (guild_id, user_id, channel_id)
-            VALUES (?, ?, ?)
-            """,
+            _SQL_INSERT_TICKET,
             (guild_id, user_id, channel_id),
         )
         await db.commit()
@@ -174,9 +436,9 @@ async def create_ticket(
 
 async def close_ticket(channel_id: int) -> None:
     """Mark the ticket associated with *channel_id* as closed."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         await db.execute(
-            "UPDATE tickets SET status = 'closed' WHERE channel_id = ?",
+            _SQL_CLOSE_TICKET,
             (channel_id,),
         )
         await db.commit()
@@ -185,21 +447,15 @@ async def close_ticket(channel_id: int) -> None:
 async def get_open_ticket(
     guild_id: int,
     user_id: int,
-) -> dict[str, Any] | None:
+) -> TicketRow | None:
     """Return the open ticket for a user in a guild, or ``None``."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    async with _connection() as db:
         cursor = await db.execute(
-            """
-            SELECT id, guild_id, user_id, channel_id, status, created_at
-            FROM tickets
-            WHERE guild_id = ? AND user_id = ? AND status = 'open'
-            LIMIT 1
-            """,
+            _SQL_SELECT_OPEN_TICKET,
             (guild_id, user_id),
         )
         row = await cursor.fetchone()
-        return dict(row) if row else None
+        return TicketRow._make(row) if row else None
 
 
 # ---------------------------------------------------------------------------
@@ -215,53 +471,71 @@ async def add_role_menu(
     role_id: int,
 ) -> None:
     """Add a reaction-role mapping for a message."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         await db.execute(
-            """
-            INSERT INTO role_menus (guild_id, channel_id, message_id, emoji, role_id)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_ROLE_MENU,
             (guild_id, channel_id, message_id, emoji, role_id),
         )
         await db.commit()
 
 
-async def get_role_menus(guild_id: int) -> list[dict[str, Any]]:
+async def add_role_menus(
+    guild_id: int,
+    channel_id: int,
+    message_id: int,
+    pairs: list[tuple[str, int]],
+) -> None:
+    """Add every ``(emoji, role_id)`` mapping in *pairs* for one message.
+
+    All rows are inserted in a single transaction, so a menu is never left
+    half-saved.
+    """
+    async with _connection() as db:
+        await db.executemany(
+            _SQL_INSERT_ROLE_MENU,
+            [
+                (guild_id, channel_id, message_id, emoji, role_id)
+                for emoji, role_id in pairs
+            ],
+        )
+        await db.commit()
+
+
+async def get_role_menus(guild_id: int) -> list[RoleMenuRow]:
     """Return all role-menu entries for a guild."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    async with _connection() as db:
         cursor = await db.execute(
-            """
-            SELECT id, guild_id, channel_id, message_id, emoji, role_id
-            FROM role_menus
-            WHERE guild_id = ?
-            """,
+            _SQL_SELECT_ROLE_MENUS,
             (guild_id,),
         )
         rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [RoleMenuRow._make(row) for row in rows]
 
 
-async def get_role_menu_by_message(message_id: int) -> list[dict[str, Any]]:
-    """Return all emoji-role mappings for a specific message.
-
-    Each dict contains ``emoji`` and ``role_id`` keys.
-    """
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_role_menu_by_message(message_id: int) -> list[RoleMapping]:
+    """Return all emoji-role mappings for a specific message."""
+    async with _connection() as db:
         cursor = await db.execute(
-            "SELECT emoji, role_id FROM role_menus WHERE message_id = ?",
+            _SQL_SELECT_ROLE_MENU_BY_MESSAGE,
             (message_id,),
         )
         rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [RoleMapping._make(row) for row in rows]
+
+
+async def get_role_menu_message_ids() -> set[int]:
+    """Return the IDs of every message that has role-menu entries."""
+    async with _connection() as db:
+        cursor = await db.execute(_SQL_SELECT_ROLE_MENU_MESSAGE_IDS)
+        rows = await cursor.fetchall()
+        return {row[0] for row in rows}
 
 
 async def delete_role_menu(message_id: int) -> None:
     """Delete all role-menu entries associated with *message_id*."""
-    async with aiosqlite.connect(config.DATABASE_PATH) as db:
+    async with _connection() as db:
         await db.execute(
-            "DELETE FROM role_menus WHERE message_id = ?",
+            _SQL_DELETE_ROLE_MENU,
             (message_id,),
         )
         await db.commit()
@@ -8,9 +8,19 @@ Every function returns a fully-formed embed so callers can simply do::
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import discord
 
+# Embed colours, built once and shared by every embed (``Color.green()`` and
+# friends construct a new object per call)
+_GREEN = discord.Color.green()
+_RED = discord.Color.red()
+_BLUE = discord.Color.blue()
+_ORANGE = discord.Color.orange()
+_YELLOW = discord.Color.yellow()
+_GREYPLE = discord.Color.greyple()
+
 
 # ---------------------------------------------------------------------------
 # Generic embeds
@@ -22,7 +32,7 @@ def success_embed(title: str, description: str = "") -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.green(),
+        color=_GREEN,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -32,7 +42,7 @@ def error_embed(title: str, description: str = "") -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.red(),
+        color=_RED,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -42,7 +52,7 @@ def info_embed(title: str, description: str = "") -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.blue(),
+        color=_BLUE,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -52,27 +62,52 @@ def warning_embed(title: str, description: str = "") -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.orange(),
+        color=_ORANGE,
         timestamp=datetime.now(timezone.utc),
     )
 
 
+def clone_embed(template: discord.Embed) -> discord.Embed:
+    """Copy of a pre-built *template* embed, re-stamped with the current time.
+
+    Lets callers build embeds whose content never changes once at import time
+    instead of on every request.
+    """
+    embed = template.copy()
+    embed.timestamp = datetime.now(timezone.utc)
+    return embed
+
+
 # ---------------------------------------------------------------------------
 # Specialised embeds
 # ---------------------------------------------------------------------------
 
 # Mapping of moderation action keywords to embed colours.
 _MOD_ACTION_COLORS: dict[str, discord.Color] = {
-    "ban": discord.Color.red(),
-    "unban": discord.Color.green(),
-    "kick": discord.Color.orange(),
-    "mute": discord.Color.orange(),
-    "unmute": discord.Color.green(),
-    "warn": discord.Color.yellow(),
-    "timeout": discord.Color.orange(),
+    "ban": _RED,
+    "unban": _GREEN,
+    "kick": _ORANGE,
+    "mute": _ORANGE,
+    "unmute": _GREEN,
+    "warn": _YELLOW,
+    "timeout": _ORANGE,
 }
 
 
+@lru_cache(maxsize=64)
+def _mod_action_color(action: str) -> discord.Color:
+    """Colour for the first action keyword found in *action* (grey if none).
+
+    Callers pass a handful of fixed action names, so after the first call
+    each is a cache hit instead of a keyword scan.
+    """
+    action_lower = action.lower()
+    for keyword, color in _MOD_ACTION_COLORS.items():
+        if keyword in action_lower:
+            return color
+    return _GREYPLE
+
+
 def mod_log_embed(
     action: str,
     moderator: discord.Member,
@@ -92,17 +127,9 @@ def mod_log_embed(
     reason:
         Optional reason string.
     """
-    # Pick a colour based on the action keyword (fall back to grey)
-    action_lower = action.lower()
-    color = discord.Color.greyple()
-    for keyword, col in _MOD_ACTION_COLORS.items():
-        if keyword in action_lower:
-            color = col
-            break
-
     embed = discord.Embed(
         title=action,
-        color=color,
+        color=_mod_action_color(action),
         timestamp=datetime.now(timezone.utc),
     )
     embed.add_field(name="Moderator", value=f"{moderator} ({moderator.id})", inline=True)
@@ -126,14 +153,11 @@ def welcome_embed(member: discord.Member) -> discord.Embed:
     embed = discord.Embed(
         title=f"Welcome to {guild.name}!",
         description=f"Hey {member.mention}, welcome to **{guild.name}**! We're glad to have you here.",
-        color=discord.Color.green(),
+        color=_GREEN,
         timestamp=datetime.now(timezone.utc),
     )
 
-    if member.avatar:
-        embed.set_thumbnail(url=member.avatar.url)
-    elif member.default_avatar:
-        embed.set_thumbnail(url=member.default_avatar.url)
+    embed.set_thumbnail(url=member.display_avatar.url)
 
     embed.add_field(
         name="Member Count",
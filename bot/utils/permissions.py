@@ -26,6 +26,13 @@ from bot.utils.embeds import error_embed
 
 T = TypeVar("T")
 
+# Any one of these is enough to count as a moderator, both for
+# :func:`is_moderator` and for auto-moderation exemptions.
+MODERATOR_MASK = discord.Permissions(
+    manage_messages=True, kick_members=True, ban_members=True
+).value
+_ADMIN_MASK = discord.Permissions(administrator=True).value
+
 
 # ---------------------------------------------------------------------------
 # Decorator factories
@@ -45,7 +52,7 @@ def is_moderator() -> Callable[[T], T]:
 
     async def predicate(interaction: discord.Interaction) -> bool:
         perms = interaction.user.guild_permissions  # type: ignore[union-attr]
-        if perms.manage_messages or perms.kick_members or perms.ban_members:
+        if perms.value & MODERATOR_MASK:
             return True
         raise app_commands.MissingPermissions(
             ["manage_messages", "kick_members", "ban_members"]
@@ -62,7 +69,7 @@ def is_admin() -> Callable[[T], T]:
 
     async def predicate(interaction: discord.Interaction) -> bool:
         perms = interaction.user.guild_permissions  # type: ignore[union-attr]
-        if perms.administrator:
+        if perms.value & _ADMIN_MASK:
             return True
         raise app_commands.MissingPermissions(["administrator"])
 
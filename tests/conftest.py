@@ -9,18 +9,20 @@ from __future__ import annotations
 
 import json
 import tempfile
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import aiohttp
 import discord
 import pytest
 import pytest_asyncio
 from discord.ext import commands
 
 from bot import config
-from bot.utils.database import init_db
+from bot.utils.database import close_db, init_db
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +40,7 @@ def mock_bot() -> MagicMock:
     bot.user.__str__ = lambda self: "TestBot#0001"
     bot.tree = MagicMock()
     bot.add_view = MagicMock()
+    bot.http_session = MagicMock(spec=aiohttp.ClientSession)
     return bot
 
 
@@ -116,12 +119,12 @@ def mock_member(mock_guild: MagicMock) -> MagicMock:
     member.guild = mock_guild
 
     # Permissions — moderator by default
-    perms = MagicMock(spec=discord.Permissions)
-    perms.manage_messages = True
-    perms.kick_members = True
-    perms.ban_members = True
-    perms.administrator = True
-    member.guild_permissions = perms
+    member.guild_permissions = discord.Permissions(
+        manage_messages=True,
+        kick_members=True,
+        ban_members=True,
+        administrator=True,
+    )
 
     # Roles
     top_role = MagicMock(spec=discord.Role)
@@ -144,6 +147,7 @@ def mock_member(mock_guild: MagicMock) -> MagicMock:
     member.avatar = avatar
     member.default_avatar = MagicMock()
     member.default_avatar.url = "https://example.com/default_avatar.png"
+    member.display_avatar = avatar
 
     # Timestamps
     member.created_at = datetime(2019, 6, 15, tzinfo=timezone.utc)
@@ -198,6 +202,7 @@ def mock_target(mock_guild: MagicMock) -> MagicMock:
     target.avatar = avatar
     target.default_avatar = MagicMock()
     target.default_avatar.url = "https://example.com/default_avatar.png"
+    target.display_avatar = avatar
 
     target.created_at = datetime(2021, 1, 10, tzinfo=timezone.utc)
     target.joined_at = datetime(2021, 5, 20, tzinfo=timezone.utc)
@@ -277,16 +282,19 @@ def mock_interaction(
 
 
 @pytest_asyncio.fixture()
-async def setup_database(tmp_path: Path) -> None:
+async def setup_database() -> None:
     """Set up an in-memory SQLite database for tests.
 
-    Monkeypatches ``config.DATABASE_PATH`` to use ``:memory:`` so tests
-    never touch the real on-disk database.
+    Monkeypatches ``config.DATABASE_PATH`` to a uniquely named shared-cache
+    ``:memory:`` URI, so tests never touch the disk or each other's data.
+    :func:`init_db` opens the pool for that URI and :func:`close_db` drops
+    it on teardown, taking the in-memory database with it.
     """
-    db_path = str(tmp_path / "test_bot.db")
+    db_path = f"file:test_bot_{uuid.uuid4().hex}?mode=memory&cache=shared"
     with patch.object(config, "DATABASE_PATH", db_path):
         await init_db()
         yield  # type: ignore[misc]
+        await close_db()
 
 
 # ---------------------------------------------------------------------------
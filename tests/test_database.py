@@ -0,0 +1,60 @@
+"""Tests for the database connection pool.
+
+Covers checkout after close, waking callers blocked on a full pool, and
+use before :func:`init_db`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from bot.utils.database import _ConnectionPool, get_warning_count
+
+
+class TestConnectionPool:
+    """Tests for ``_ConnectionPool`` shutdown."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        # In-memory databases get a single connection, so a second caller waits
+        path = f"file:test_pool_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self.pool = _ConnectionPool(path)
+
+    async def test_checkout_after_close_raises(self) -> None:
+        await self.pool.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            async with self.pool.connection():
+                pass
+
+    async def test_close_wakes_waiting_callers(self) -> None:
+        async def wait_for_connection() -> None:
+            async with self.pool.connection():
+                pass
+
+        async with self.pool.connection():
+            waiter = asyncio.create_task(wait_for_connection())
+            await asyncio.sleep(0)
+            await self.pool.close()
+
+            with pytest.raises(RuntimeError, match="closed while waiting"):
+                await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_connection_returned_after_close_is_closed(self) -> None:
+        async with self.pool.connection() as conn:
+            await self.pool.close()
+
+        with pytest.raises(ValueError):
+            await conn.execute("SELECT 1")
+
+
+class TestInitDb:
+    """Tests for the pool lifecycle managed by ``init_db``/``close_db``."""
+
+    async def test_queries_before_init_db_raise(self) -> None:
+        """Verify helpers refuse to run until init_db() has opened the pool."""
+        with pytest.raises(RuntimeError, match="init_db"):
+            await get_warning_count(1, 2)
@@ -6,14 +6,16 @@ including error paths (404, 401, invalid currency, amount validation).
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import discord
 import pytest
+from discord import app_commands
 
 from bot import config
-from bot.cogs.integrations import Integrations
+from bot.cogs.integrations import _FX_TTL, Integrations
 
 
 # ===================================================================
@@ -24,10 +26,12 @@ from bot.cogs.integrations import Integrations
 def _make_response(
     status: int = 200,
     json_data: dict | None = None,
+    headers: dict[str, str] | None = None,
 ) -> MagicMock:
     """Create a mock aiohttp response as an async context manager."""
     resp = MagicMock()
     resp.status = status
+    resp.headers = headers or {}
     resp.json = AsyncMock(return_value=json_data or {})
 
     # Make it work as an async context manager
@@ -53,15 +57,16 @@ class TestWeatherCommand:
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
-        self.cog = Integrations(self.bot)
-        self.cog.session = MagicMock(spec=aiohttp.ClientSession)
 
-        # Patch the API key to a non-empty value
+        # Patch the API key to a non-empty value (bound when the cog is built)
         self._api_patch = patch.object(
             config, "OPENWEATHER_API_KEY", "test-api-key-123"
         )
         self._api_patch.start()
 
+        self.cog = Integrations(self.bot)
+        self.cog.session = MagicMock(spec=aiohttp.ClientSession)
+
     def teardown_method(self) -> None:
         self._api_patch.stop()
 
@@ -132,6 +137,23 @@ class TestWeatherCommand:
         temp_field = next(f for f in embed.fields if f.name == "Temperature")
         assert "22.0" in temp_field.value
 
+    async def test_weather_request_params(self) -> None:
+        """Verify the city, API key, and metric units are sent upstream."""
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(404)
+        )
+
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Dublin"
+        )
+
+        params = self.cog.session.get.call_args.kwargs.get("params")
+        assert params == {
+            "q": "Dublin",
+            "appid": "test-api-key-123",
+            "units": "metric",
+        }
+
     async def test_weather_city_not_found_404(self) -> None:
         """Verify a 404 response produces a 'City Not Found' error embed."""
         self.cog.session.get = MagicMock(
@@ -167,9 +189,8 @@ class TestWeatherCommand:
     async def test_weather_no_api_key_configured(self) -> None:
         """Verify an error when the API key is empty."""
         with patch.object(config, "OPENWEATHER_API_KEY", ""):
-            await self.cog.weather.callback(
-                self.cog, self.interaction, city="London"
-            )
+            cog = Integrations(self.bot)
+        await cog.weather.callback(cog, self.interaction, city="London")
 
         call_kwargs = self.interaction.response.send_message.call_args
         embed = call_kwargs.kwargs.get("embed")
@@ -216,6 +237,209 @@ class TestWeatherCommand:
         embed = call_kwargs.kwargs.get("embed")
         assert "OpenWeatherMap" in embed.footer.text
 
+    async def test_weather_repeat_lookup_served_from_cache(self) -> None:
+        """Verify a repeated lookup for the same city skips the API call."""
+        json_data = {
+            "name": "Oslo",
+            "weather": [{"description": "snow", "icon": "13d"}],
+            "main": {
+                "temp": -3.0,
+                "feels_like": -7.0,
+                "humidity": 90,
+                "pressure": 1002,
+            },
+            "wind": {"speed": 4.0},
+        }
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(200, json_data)
+        )
+
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Oslo"
+        )
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="  oslo "
+        )
+
+        self.cog.session.get.assert_called_once()
+        assert self.interaction.response.send_message.await_count == 2
+        embed = self.interaction.response.send_message.call_args.kwargs.get("embed")
+        assert "Oslo" in embed.title
+
+    async def test_weather_cache_expires_after_stale_window(self) -> None:
+        """Verify an entry past its stale window triggers a fresh fetch."""
+        json_data = {
+            "name": "Rome",
+            "weather": [{"description": "sunny", "icon": "01d"}],
+            "main": {
+                "temp": 28.0,
+                "feels_like": 29.0,
+                "humidity": 40,
+                "pressure": 1018,
+            },
+            "wind": {"speed": 2.0},
+        }
+        self.cog.session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_response(200, json_data)
+        )
+
+        with patch("bot.cogs.integrations.time.monotonic", return_value=1000.0):
+            await self.cog.weather.callback(
+                self.cog, self.interaction, city="Rome"
+            )
+        with patch("bot.cogs.integrations.time.monotonic", return_value=5000.0):
+            await self.cog.weather.callback(
+                self.cog, self.interaction, city="Rome"
+            )
+
+        assert self.cog.session.get.call_count == 2
+        self.interaction.response.defer.assert_awaited()
+
+    async def test_weather_stale_entry_served_and_refreshed(self) -> None:
+        """Verify a stale entry is served immediately and refreshed in the background."""
+        stale = {
+            "name": "Vienna",
+            "weather": [{"description": "mist", "icon": "50d"}],
+            "main": {
+                "temp": 9.0,
+                "feels_like": 7.0,
+                "humidity": 93,
+                "pressure": 1011,
+            },
+            "wind": {"speed": 1.0},
+        }
+        fresh = {**stale, "main": {**stale["main"], "temp": 12.0}}
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(200, fresh)
+        )
+
+        with patch("bot.cogs.integrations.time.monotonic", return_value=1000.0):
+            self.cog._cache_weather("vienna", stale)
+        with patch("bot.cogs.integrations.time.monotonic", return_value=1500.0):
+            await self.cog.weather.callback(
+                self.cog, self.interaction, city="Vienna"
+            )
+            # Second call while the refresh is pending must not start another
+            await self.cog.weather.callback(
+                self.cog, self.interaction, city="Vienna"
+            )
+            task = self.cog._weather_refreshes["vienna"]
+            await task
+
+        self.interaction.response.defer.assert_not_awaited()
+        embed = self.interaction.response.send_message.call_args.kwargs.get("embed")
+        temp_field = next(f for f in embed.fields if f.name == "Temperature")
+        assert "9.0" in temp_field.value
+        self.cog.session.get.assert_called_once()
+        assert self.cog._weather_cache["vienna"][2]["main"]["temp"] == 12.0
+
+    async def test_weather_defers_and_follows_up_on_cache_miss(self) -> None:
+        """Verify an uncached lookup defers first and replies via followup."""
+        json_data = {
+            "name": "Madrid",
+            "weather": [{"description": "clear sky", "icon": "01d"}],
+            "main": {
+                "temp": 30.0,
+                "feels_like": 31.0,
+                "humidity": 20,
+                "pressure": 1012,
+            },
+            "wind": {"speed": 1.5},
+        }
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(200, json_data)
+        )
+        response = self.interaction.response
+        response.defer = AsyncMock(
+            side_effect=lambda **kw: response.is_done.configure_mock(return_value=True)
+        )
+
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Madrid"
+        )
+
+        response.defer.assert_awaited_once_with(thinking=True)
+        response.send_message.assert_not_awaited()
+        embed = self.interaction.followup.send.call_args.kwargs.get("embed")
+        assert "Madrid" in embed.title
+
+    async def test_weather_cache_hit_does_not_defer(self) -> None:
+        """Verify a cached lookup responds directly without deferring."""
+        self.cog._cache_weather(
+            "lisbon",
+            {
+                "name": "Lisbon",
+                "weather": [{"description": "few clouds", "icon": "02d"}],
+                "main": {
+                    "temp": 21.0,
+                    "feels_like": 21.0,
+                    "humidity": 55,
+                    "pressure": 1016,
+                },
+                "wind": {"speed": 3.0},
+            },
+        )
+
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Lisbon"
+        )
+
+        self.interaction.response.defer.assert_not_awaited()
+        self.interaction.response.send_message.assert_awaited_once()
+
+    async def test_weather_concurrent_lookups_share_one_request(self) -> None:
+        """Verify concurrent lookups for the same city make a single API call."""
+        json_data = {
+            "name": "Prague",
+            "weather": [{"description": "drizzle", "icon": "09d"}],
+            "main": {
+                "temp": 11.0,
+                "feels_like": 10.0,
+                "humidity": 80,
+                "pressure": 1009,
+            },
+            "wind": {"speed": 2.5},
+        }
+        release = asyncio.Event()
+        ctx = _make_response(200, json_data)
+        resp = await ctx.__aenter__()
+
+        async def _slow_enter() -> MagicMock:
+            await release.wait()
+            return resp
+
+        ctx.__aenter__ = AsyncMock(side_effect=_slow_enter)
+        self.cog.session.get = MagicMock(return_value=ctx)
+
+        calls = asyncio.gather(
+            *(
+                self.cog.weather.callback(self.cog, self.interaction, city="Prague")
+                for _ in range(3)
+            )
+        )
+        await asyncio.sleep(0)
+        release.set()
+        await calls
+
+        self.cog.session.get.assert_called_once()
+        assert self.interaction.response.send_message.await_count == 3
+        assert not self.cog._weather_inflight
+
+    async def test_weather_errors_are_not_cached(self) -> None:
+        """Verify a failed lookup is retried on the next invocation."""
+        self.cog.session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_response(404)
+        )
+
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Atlantis"
+        )
+        await self.cog.weather.callback(
+            self.cog, self.interaction, city="Atlantis"
+        )
+
+        assert self.cog.session.get.call_count == 2
+
 
 # ===================================================================
 # /convert tests
@@ -395,6 +619,48 @@ class TestConvertCommand:
         assert embed is not None
         assert "Invalid" in embed.title
 
+    async def test_convert_rounds_half_up_without_float_drift(self) -> None:
+        """Verify results are rounded half-up on exact decimal values."""
+        json_data = {
+            "result": "success",
+            "rates": {"EUR": 0.5},
+            "time_last_update_utc": "Mon, 01 Jan 2024",
+        }
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(200, json_data)
+        )
+
+        await self.cog.convert.callback(
+            self.cog,
+            self.interaction,
+            amount=1.15,
+            from_currency="USD",
+            to_currency="EUR",
+        )
+
+        embed = self.interaction.response.send_message.call_args.kwargs.get("embed")
+        # 1.15 * 0.5 = 0.575 -> 0.58 (float rounding gives 0.57)
+        assert "**0.58 EUR**" in embed.description
+
+    async def test_convert_unknown_currency_rejected_before_request(self) -> None:
+        """Verify a well-formed but unknown code is rejected without an API call."""
+        self.cog.session.get = MagicMock()
+
+        await self.cog.convert.callback(
+            self.cog,
+            self.interaction,
+            amount=10.0,
+            from_currency="USD",
+            to_currency="QQQ",
+        )
+
+        self.cog.session.get.assert_not_called()
+        call_kwargs = self.interaction.response.send_message.call_args
+        embed = call_kwargs.kwargs.get("embed")
+        assert embed is not None
+        assert "Invalid" in embed.title
+        assert "QQQ" in embed.description
+
     async def test_convert_currencies_are_uppercased(self) -> None:
         """Verify lowercase currency inputs are normalized to uppercase."""
         json_data = {
@@ -443,3 +709,250 @@ class TestConvertCommand:
         embed = call_kwargs.kwargs.get("embed")
         field_names = [f.name for f in embed.fields]
         assert "Last Updated" in field_names
+
+    async def test_convert_rates_cached_per_base_currency(self) -> None:
+        """Verify a second conversion from the same base skips the API call."""
+        json_data = {
+            "result": "success",
+            "rates": {"EUR": 0.85, "GBP": 0.73},
+            "time_last_update_utc": "Mon, 01 Jan 2024",
+        }
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(200, json_data)
+        )
+
+        await self.cog.convert.callback(
+            self.cog,
+            self.interaction,
+            amount=10.0,
+            from_currency="USD",
+            to_currency="EUR",
+        )
+        await self.cog.convert.callback(
+            self.cog,
+            self.interaction,
+            amount=10.0,
+            from_currency="usd",
+            to_currency="GBP",
+        )
+
+        self.cog.session.get.assert_called_once()
+        embed = self.interaction.response.send_message.call_args.kwargs.get("embed")
+        assert "7.30" in embed.description
+
+    async def test_convert_failed_response_not_cached(self) -> None:
+        """Verify an unsuccessful API response is not stored in the cache."""
+        self.cog.session.get = MagicMock(
+            side_effect=lambda *a, **kw: _make_response(200, {"result": "error"})
+        )
+
+        for _ in range(2):
+            await self.cog.convert.callback(
+                self.cog,
+                self.interaction,
+                amount=10.0,
+                from_currency="EUR",
+                to_currency="USD",
+            )
+
+        assert self.cog.session.get.call_count == 2
+
+    async def test_convert_degraded_table_does_not_replace_cache(self) -> None:
+        """Verify a refreshed table with fewer rates keeps the cached one."""
+        full = {"result": "success", "rates": {"EUR": 0.85, "GBP": 0.73}}
+        partial = {"result": "success", "rates": {"EUR": 0.90}}
+
+        self.cog._cache_rates("USD", full)
+        self.cog._cache_rates("USD", partial)
+
+        assert self.cog._fx_cache["USD"][1] == full
+
+    async def test_convert_smaller_table_replaces_expired_cache(self) -> None:
+        """Verify a smaller table still replaces a cached one that has expired."""
+        full = {"result": "success", "rates": {"EUR": 0.85, "GBP": 0.73}}
+        partial = {"result": "success", "rates": {"EUR": 0.90}}
+
+        with patch("bot.cogs.integrations.time.monotonic", return_value=1000.0):
+            self.cog._cache_rates("USD", full)
+        with patch(
+            "bot.cogs.integrations.time.monotonic",
+            return_value=1000.0 + _FX_TTL,
+        ):
+            self.cog._cache_rates("USD", partial)
+
+        assert self.cog._fx_cache["USD"][1] == partial
+
+    async def test_convert_cache_keeps_only_used_fields(self) -> None:
+        """Verify upstream metadata is dropped from cached rate tables."""
+        self.cog._cache_rates(
+            "USD",
+            {
+                "result": "success",
+                "provider": "https://www.exchangerate-api.com",
+                "terms_of_use": "https://www.exchangerate-api.com/terms",
+                "rates": {"EUR": 0.85},
+                "time_last_update_utc": "Mon, 01 Jan 2024",
+            },
+        )
+
+        assert set(self.cog._fx_cache["USD"][1]) == {
+            "result",
+            "rates",
+            "time_last_update_utc",
+        }
+
+
+# ===================================================================
+# Rate limiting tests
+# ===================================================================
+
+
+class TestRateLimiting:
+    """Tests for the per-user cooldown on API-backed commands."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_interaction: MagicMock,
+    ) -> None:
+        self.interaction = mock_interaction
+        self.cog = Integrations(mock_bot)
+
+    def test_commands_have_cooldown_check(self) -> None:
+        """Verify both API-backed commands carry a cooldown check."""
+        assert self.cog.weather.checks
+        assert self.cog.convert.checks
+
+    async def test_cooldown_error_shows_slow_down_embed(self) -> None:
+        """Verify hitting the cooldown produces an ephemeral 'Slow Down' embed."""
+        error = app_commands.CommandOnCooldown(
+            app_commands.Cooldown(3, 60), retry_after=42.0
+        )
+
+        await self.cog.cog_app_command_error(self.interaction, error)
+
+        call_kwargs = self.interaction.response.send_message.call_args
+        embed = call_kwargs.kwargs.get("embed")
+        assert embed is not None
+        assert "Slow Down" in embed.title
+        assert "42s" in embed.description
+        assert call_kwargs.kwargs.get("ephemeral") is True
+
+
+# ===================================================================
+# Upstream retry tests
+# ===================================================================
+
+
+class TestUpstreamRetries:
+    """Tests for the 429 / network-error retry policy of ``_get_json``."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_bot: MagicMock) -> None:
+        self.cog = Integrations(mock_bot)
+        self.cog.session = MagicMock(spec=aiohttp.ClientSession)
+        self._sleep_patch = patch(
+            "bot.cogs.integrations.asyncio.sleep", new_callable=AsyncMock
+        )
+        self.sleep = self._sleep_patch.start()
+
+    def teardown_method(self) -> None:
+        self._sleep_patch.stop()
+
+    async def test_429_retried_after_retry_after_delay(self) -> None:
+        """Verify a 429 is retried after sleeping for Retry-After seconds."""
+        self.cog.session.get = MagicMock(
+            side_effect=[
+                _make_response(429, headers={"Retry-After": "1.5"}),
+                _make_response(200, {"ok": True}),
+            ]
+        )
+
+        status, data = await self.cog._get_json("https://example.com")
+
+        assert status == 200
+        assert data == {"ok": True}
+        self.sleep.assert_awaited_once_with(1.5)
+
+    async def test_429_gives_up_when_wait_budget_exceeded(self) -> None:
+        """Verify a Retry-After beyond the wait budget is not slept on."""
+        self.cog.session.get = MagicMock(
+            return_value=_make_response(429, headers={"Retry-After": "30"})
+        )
+
+        status, data = await self.cog._get_json("https://example.com")
+
+        assert status == 429
+        assert data is None
+        self.sleep.assert_not_awaited()
+
+    async def test_network_error_retried_with_backoff(self) -> None:
+        """Verify network errors are retried with exponential backoff."""
+        failing = MagicMock()
+        failing.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError())
+        failing.__aexit__ = AsyncMock(return_value=False)
+        self.cog.session.get = MagicMock(
+            side_effect=[failing, failing, _make_response(200, {"ok": True})]
+        )
+
+        status, _ = await self.cog._get_json("https://example.com")
+
+        assert status == 200
+        assert [c.args[0] for c in self.sleep.await_args_list] == [0.25, 0.5]
+
+    async def test_network_error_reraised_after_max_retries(self) -> None:
+        """Verify the network error propagates once retries are exhausted."""
+        failing = MagicMock()
+        failing.__aenter__ = AsyncMock(side_effect=aiohttp.ClientError())
+        failing.__aexit__ = AsyncMock(return_value=False)
+        self.cog.session.get = MagicMock(return_value=failing)
+
+        with pytest.raises(aiohttp.ClientError):
+            await self.cog._get_json("https://example.com")
+
+        assert self.cog.session.get.call_count == 3
+
+
+# ===================================================================
+# Error handler tests
+# ===================================================================
+
+
+class TestErrorHandler:
+    """Tests for ``Integrations.cog_app_command_error``."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_interaction: MagicMock,
+    ) -> None:
+        self.interaction = mock_interaction
+        self.cog = Integrations(mock_bot)
+
+    async def test_unexpected_error_uses_followup_once_deferred(self) -> None:
+        """Verify the generic error goes through the followup after a defer."""
+        self.interaction.response.is_done.return_value = True
+
+        await self.cog.cog_app_command_error(
+            self.interaction, app_commands.AppCommandError("boom")
+        )
+
+        self.interaction.response.send_message.assert_not_awaited()
+        call_kwargs = self.interaction.followup.send.call_args
+        assert call_kwargs.kwargs.get("embed").title == "Unexpected Error"
+        assert call_kwargs.kwargs.get("ephemeral") is True
+
+    async def test_unexpected_error_embed_is_a_fresh_copy(self) -> None:
+        """Verify each error response gets its own embed instance."""
+        for _ in range(2):
+            await self.cog.cog_app_command_error(
+                self.interaction, app_commands.AppCommandError("boom")
+            )
+
+        first, second = (
+            c.kwargs.get("embed")
+            for c in self.interaction.response.send_message.call_args_list
+        )
+        assert first is not second
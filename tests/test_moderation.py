@@ -6,15 +6,28 @@ the duration parser used by /mute.
 
 from __future__ import annotations
 
+import json
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
+from discord import app_commands
 
 from bot import config
-from bot.cogs.moderation import Moderation, _parse_duration
-from bot.utils.database import add_warning, get_warning_count, get_warnings
+from bot.cogs.moderation import (
+    Moderation,
+    _compile_word_filter,
+    _content_digest,
+    _MessageRecord,
+    _parse_duration,
+)
+from bot.utils.database import (
+    add_warning,
+    get_warning_count,
+    get_warnings,
+    get_warnings_with_count,
+)
 
 
 # ===================================================================
@@ -74,12 +87,95 @@ class TestParseDuration:
         result = _parse_duration("ten minutes")
         assert result is None
 
+    def test_parse_space_before_unit(self) -> None:
+        result = _parse_duration("10 m")
+        assert result is not None
+        assert result.total_seconds() == 600
+
+    def test_parse_invalid_signed_number(self) -> None:
+        result = _parse_duration("-5m")
+        assert result is None
+
+    def test_parse_invalid_compound(self) -> None:
+        result = _parse_duration("1h30m")
+        assert result is None
+
+    def test_parse_invalid_repeated_unit(self) -> None:
+        result = _parse_duration("10mm")
+        assert result is None
+
     def test_parse_zero_value(self) -> None:
         result = _parse_duration("0m")
         assert result is not None
         assert result.total_seconds() == 0
 
 
+# ===================================================================
+# Spam-tracker unit tests
+# ===================================================================
+
+
+class TestMessageRecord:
+    """Unit tests for ``_MessageRecord`` and ``_content_digest``."""
+
+    def test_digest_is_stable_and_distinct(self) -> None:
+        assert _content_digest("hi") == _content_digest("hi")
+        assert _content_digest("hi") != _content_digest("hi!")
+        assert 0 <= _content_digest("hi") < 2**64
+
+    def test_identical_count(self) -> None:
+        hi, other = _content_digest("hi"), _content_digest("other")
+        record = _MessageRecord(10)
+        record.add(hi, 1.0, 1, 1)
+        record.add(hi, 2.0, 1, 1)
+        record.add(other, 3.0, 1, 1)
+        assert record.identical_count(hi) == 2
+        assert record.identical_count(other) == 1
+        assert record.identical_count(_content_digest("missing")) == 0
+
+    def test_prune_drops_old_entries_and_counts(self) -> None:
+        hi, old = _content_digest("hi"), _content_digest("old")
+        record = _MessageRecord(10)
+        record.add(hi, 1.0, 1, 1)
+        record.add(old, 2.0, 1, 1)
+        record.add(hi, 5.0, 1, 1)
+        record.prune(4.0)
+        assert record.identical_count(hi) == 1
+        assert old not in record.counts
+
+    def test_add_returns_identical_count(self) -> None:
+        hi, other = _content_digest("hi"), _content_digest("other")
+        record = _MessageRecord(10)
+        assert record.add(hi, 1.0, 1, 1) == 1
+        assert record.add(other, 2.0, 1, 2) == 1
+        assert record.add(hi, 3.0, 1, 3) == 2
+
+    def test_full_record_evicts_oldest(self) -> None:
+        hi, other = _content_digest("hi"), _content_digest("other")
+        record = _MessageRecord(2)
+        record.add(hi, 1.0, 1, 1)
+        record.add(other, 2.0, 1, 2)
+        record.add(other, 3.0, 1, 3)
+        assert len(record.messages) == 2
+        assert hi not in record.counts
+        assert record.identical_count(other) == 2
+
+    def test_message_ids_filters_by_channel(self) -> None:
+        hi = _content_digest("hi")
+        record = _MessageRecord(10)
+        record.add(hi, 1.0, 10, 100)
+        record.add(hi, 2.0, 20, 200)
+        record.add(hi, 3.0, 10, 300)
+        assert record.message_ids(10) == [100, 300]
+
+    def test_prune_everything(self) -> None:
+        record = _MessageRecord(10)
+        record.add(_content_digest("hi"), 1.0, 1, 1)
+        record.prune(10.0)
+        assert not record.messages
+        assert not record.counts
+
+
 # ===================================================================
 # Moderation cog command tests
 # ===================================================================
@@ -135,13 +231,47 @@ class TestKickCommand:
         embed = call_kwargs.kwargs.get("embed") or call_kwargs.args[0]
         assert embed is not None
 
+    async def test_mod_log_failure_does_not_fail_kick(self) -> None:
+        """Verify a failed mod-log send is logged and the success reply stands."""
+        self.mod_log_channel.send.side_effect = discord.Forbidden(
+            MagicMock(status=403), "Missing Access"
+        )
+        await self.cog.kick.callback(
+            self.cog, self.interaction, self.target, reason="Test reason"
+        )
+
+        self.interaction.followup.send.assert_awaited_once()
+        embed = self.interaction.followup.send.call_args.kwargs.get("embed")
+        assert "Kicked" in embed.title
+
+    async def test_mod_log_channel_is_cached_per_guild(self) -> None:
+        """Verify the mod-log channel is resolved once and then reused."""
+        guild = self.interaction.guild
+        await self.cog._send_mod_log(guild, MagicMock())
+        guild.text_channels = []
+        await self.cog._send_mod_log(guild, MagicMock())
+
+        assert self.mod_log_channel.send.await_count == 2
+
+    async def test_channel_delete_invalidates_mod_log_cache(self) -> None:
+        """Verify deleting a channel forces the mod-log channel to be re-resolved."""
+        guild = self.interaction.guild
+        await self.cog._send_mod_log(guild, MagicMock())
+        guild.text_channels = []
+        self.mod_log_channel.guild = guild
+        await self.cog.on_guild_channel_delete(self.mod_log_channel)
+        await self.cog._send_mod_log(guild, MagicMock())
+
+        self.mod_log_channel.send.assert_awaited_once()
+
     async def test_kick_sends_success_response(self) -> None:
-        """Verify the interaction gets a success response."""
+        """Verify the deferred interaction gets a success followup."""
         await self.cog.kick.callback(
             self.cog, self.interaction, self.target, reason="Test reason"
         )
-        self.interaction.response.send_message.assert_awaited()
-        call_kwargs = self.interaction.response.send_message.call_args
+        self.interaction.response.defer.assert_awaited_once()
+        self.interaction.followup.send.assert_awaited()
+        call_kwargs = self.interaction.followup.send.call_args
         embed = call_kwargs.kwargs.get("embed")
         assert embed is not None
         assert "Kicked" in embed.title
@@ -153,6 +283,30 @@ class TestKickCommand:
         )
         self.target.send.assert_awaited_once()
 
+    async def test_kick_dms_target_before_kicking(self) -> None:
+        """Verify the DM goes out while the target is still in the server."""
+        order: list[str] = []
+        self.target.send.side_effect = lambda **_: order.append("dm")
+        self.target.kick.side_effect = lambda **_: order.append("kick")
+
+        await self.cog.kick.callback(
+            self.cog, self.interaction, self.target, reason="Test reason"
+        )
+
+        assert order == ["dm", "kick"]
+
+    async def test_kick_closed_dms_still_kicks(self) -> None:
+        """Verify a failed DM does not stop the kick."""
+        self.target.send.side_effect = discord.Forbidden(
+            MagicMock(status=403), "Cannot send messages to this user"
+        )
+
+        await self.cog.kick.callback(
+            self.cog, self.interaction, self.target, reason="Test reason"
+        )
+
+        self.target.kick.assert_awaited_once()
+
     async def test_kick_higher_role_refused(self) -> None:
         """Verify kick is refused when target has a higher role."""
         # Make the target's role higher than the bot's
@@ -206,12 +360,13 @@ class TestBanCommand:
         self.target.ban.assert_awaited_once_with(reason="Ban reason")
 
     async def test_ban_sends_success_response(self) -> None:
-        """Verify the interaction gets a success response."""
+        """Verify the deferred interaction gets a success followup."""
         await self.cog.ban.callback(
             self.cog, self.interaction, self.target, reason="Ban reason"
         )
-        self.interaction.response.send_message.assert_awaited()
-        call_kwargs = self.interaction.response.send_message.call_args
+        self.interaction.response.defer.assert_awaited_once()
+        self.interaction.followup.send.assert_awaited()
+        call_kwargs = self.interaction.followup.send.call_args
         embed = call_kwargs.kwargs.get("embed")
         assert embed is not None
         assert "Banned" in embed.title
@@ -373,24 +528,16 @@ class TestWarnCommand:
         mock_target: MagicMock,
         mock_config_file: MagicMock,
         setup_database: None,
-        tmp_path: MagicMock,
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
         self.target = mock_target
-        self.tmp_path = tmp_path
 
         self._config_patch = patch.object(
             config, "CONFIG_PATH", str(mock_config_file)
         )
         self._config_patch.start()
 
-        # Patch DATABASE_PATH for the warn command's DB calls
-        self._db_patch = patch.object(
-            config, "DATABASE_PATH", str(tmp_path / "test_bot.db")
-        )
-        self._db_patch.start()
-
         mod_log_channel = MagicMock(spec=discord.TextChannel)
         mod_log_channel.name = "mod-log"
         mod_log_channel.send = AsyncMock()
@@ -401,7 +548,6 @@ class TestWarnCommand:
 
     def teardown_method(self) -> None:
         self._config_patch.stop()
-        self._db_patch.stop()
 
     async def test_warn_saves_to_database(self) -> None:
         """Verify that warn persists the warning in the database."""
@@ -428,7 +574,7 @@ class TestWarnCommand:
             self.cog, self.interaction, self.target, reason="Second warning"
         )
 
-        call_kwargs = self.interaction.response.send_message.call_args
+        call_kwargs = self.interaction.followup.send.call_args
         embed = call_kwargs.kwargs.get("embed")
         assert embed is not None
         # Total should be 2
@@ -460,28 +606,20 @@ class TestWarningsCommand:
         mock_target: MagicMock,
         mock_config_file: MagicMock,
         setup_database: None,
-        tmp_path: MagicMock,
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
         self.target = mock_target
-        self.tmp_path = tmp_path
 
         self._config_patch = patch.object(
             config, "CONFIG_PATH", str(mock_config_file)
         )
         self._config_patch.start()
 
-        self._db_patch = patch.object(
-            config, "DATABASE_PATH", str(tmp_path / "test_bot.db")
-        )
-        self._db_patch.start()
-
         self.cog = Moderation(self.bot)
 
     def teardown_method(self) -> None:
         self._config_patch.stop()
-        self._db_patch.stop()
 
     async def test_warnings_no_records(self) -> None:
         """Verify a 'no warnings' message when there are none."""
@@ -547,3 +685,322 @@ class TestWarningsCommand:
         embed = call_kwargs.kwargs.get("embed")
         assert "Specific reason text" in embed.description
         assert "Moderator" in embed.description
+
+    async def test_warnings_resolves_each_moderator_once(self) -> None:
+        """Verify a moderator with several warnings is looked up only once."""
+        for reason in ("First", "Second", "Third"):
+            await add_warning(
+                guild_id=self.interaction.guild.id,
+                user_id=self.target.id,
+                moderator_id=self.interaction.user.id,
+                reason=reason,
+            )
+        self.interaction.guild.get_member = MagicMock(return_value=None)
+
+        await self.cog.warnings.callback(
+            self.cog, self.interaction, self.target
+        )
+
+        self.interaction.guild.get_member.assert_called_once_with(
+            self.interaction.user.id
+        )
+        embed = self.interaction.response.send_message.call_args.kwargs.get("embed")
+        assert embed.description.count("Unknown (ID:") == 3
+
+    async def test_warnings_with_count_matches_separate_queries(self) -> None:
+        """Verify the combined read agrees with get_warnings/get_warning_count."""
+        for reason in ("First", "Second"):
+            await add_warning(
+                guild_id=self.interaction.guild.id,
+                user_id=self.target.id,
+                moderator_id=self.interaction.user.id,
+                reason=reason,
+            )
+        guild_id, user_id = self.interaction.guild.id, self.target.id
+
+        records, count = await get_warnings_with_count(guild_id, user_id)
+
+        assert records == await get_warnings(guild_id, user_id)
+        assert count == await get_warning_count(guild_id, user_id) == 2
+
+
+# ===================================================================
+# Auto-moderation tests
+# ===================================================================
+
+
+class TestCompileWordFilter:
+    """Unit tests for the trie-factored word-filter pattern."""
+
+    def test_empty_list_compiles_to_none(self) -> None:
+        assert _compile_word_filter(["", ""]) is None
+
+    def test_words_sharing_a_prefix(self) -> None:
+        pattern = _compile_word_filter(["bad", "badword", "bat"])
+        assert pattern is not None
+        assert pattern.search("so bad").group(0) == "bad"
+        assert pattern.search("a badword here").group(0) == "badword"
+        assert pattern.search("bat!").group(0) == "bat"
+        assert pattern.search("badwordy batty") is None
+
+    def test_special_characters_are_literal(self) -> None:
+        pattern = _compile_word_filter(["a.b", "c++"])
+        assert pattern is not None
+        assert pattern.search("axb") is None
+        assert pattern.search("i like c++") is not None
+
+
+class TestErrorHandler:
+    """Tests for ``Moderation.cog_app_command_error``."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_interaction: MagicMock,
+        mock_config_file: MagicMock,
+    ) -> None:
+        self._config_patch = patch.object(
+            config, "CONFIG_PATH", str(mock_config_file)
+        )
+        self._config_patch.start()
+
+        self.interaction = mock_interaction
+        self.cog = Moderation(mock_bot)
+
+    def teardown_method(self) -> None:
+        self._config_patch.stop()
+
+    async def test_unexpected_error_uses_followup_once_deferred(self) -> None:
+        """Verify the generic error goes through the followup after a defer."""
+        self.interaction.response.is_done.return_value = True
+
+        await self.cog.cog_app_command_error(
+            self.interaction, app_commands.AppCommandError("boom")
+        )
+
+        self.interaction.response.send_message.assert_not_awaited()
+        call_kwargs = self.interaction.followup.send.call_args
+        assert call_kwargs.kwargs.get("embed").title == "Unexpected Error"
+        assert call_kwargs.kwargs.get("ephemeral") is True
+
+    async def test_unexpected_error_embed_is_a_fresh_copy(self) -> None:
+        """Verify each error response gets its own embed instance."""
+        for _ in range(2):
+            await self.cog.cog_app_command_error(
+                self.interaction, app_commands.AppCommandError("boom")
+            )
+
+        first, second = (
+            c.kwargs.get("embed")
+            for c in self.interaction.response.send_message.call_args_list
+        )
+        assert first is not second
+        assert first.title == second.title == "Unexpected Error"
+
+    async def test_failed_reply_is_swallowed(self) -> None:
+        """Verify a failed error reply does not propagate."""
+        self.interaction.response.send_message.side_effect = discord.HTTPException(
+            MagicMock(status=404), "Unknown interaction"
+        )
+
+        await self.cog.cog_app_command_error(
+            self.interaction, app_commands.AppCommandError("boom")
+        )
+
+        self.interaction.response.send_message.assert_awaited_once()
+
+
+class TestWordFilter:
+    """Tests for the word-filter branch of the ``on_message`` listener."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_target: MagicMock,
+        mock_text_channel: MagicMock,
+        mock_config_file: MagicMock,
+    ) -> None:
+        self._config_patch = patch.object(
+            config, "CONFIG_PATH", str(mock_config_file)
+        )
+        self._config_patch.start()
+
+        # Regular member -- not exempt from auto-moderation
+        mock_target.guild_permissions = discord.Permissions(send_messages=True)
+
+        self.channel = mock_text_channel
+        self.channel.send = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
+
+        self.message = MagicMock(spec=discord.Message)
+        self.message.author = mock_target
+        self.message.guild = mock_target.guild
+        self.message.channel = self.channel
+        self.message.delete = AsyncMock()
+
+        self.cog = Moderation(mock_bot)
+
+    def teardown_method(self) -> None:
+        self._config_patch.stop()
+
+    async def test_filtered_word_deletes_message(self) -> None:
+        """Verify a message containing a filtered word is deleted."""
+        self.message.content = "this contains BadWord1 somewhere"
+
+        await self.cog.on_message(self.message)
+
+        self.message.delete.assert_awaited_once()
+        embed = self.channel.send.call_args.kwargs.get("embed")
+        assert "Removed" in embed.title
+
+    async def test_filtered_word_inside_longer_word_is_kept(self) -> None:
+        """Verify filtered words only match as whole words."""
+        self.message.content = "xbadword1x is not a filtered word"
+
+        await self.cog.on_message(self.message)
+
+        self.message.delete.assert_not_awaited()
+
+    async def test_filtered_word_next_to_punctuation_matches(self) -> None:
+        """Verify punctuation around a filtered word does not hide it."""
+        self.message.content = "well...badword2!"
+
+        await self.cog.on_message(self.message)
+
+        self.message.delete.assert_awaited_once()
+
+    async def test_moderator_is_exempt(self) -> None:
+        """Verify members with a moderation permission skip the filter."""
+        self.message.author.guild_permissions = discord.Permissions(kick_members=True)
+        self.message.content = "badword1"
+
+        await self.cog.on_message(self.message)
+
+        self.message.delete.assert_not_awaited()
+
+    async def test_auto_mod_off_skips_checks(self) -> None:
+        """Verify nothing runs when the filter is empty and spam detection is off."""
+        self.cog._word_filter_re = None
+        self.cog._spam_enabled = False
+        self.message.content = MagicMock()
+
+        await self.cog.on_message(self.message)
+
+        self.message.content.casefold.assert_not_called()
+        assert not self.cog._spam_tracker
+
+    async def test_clean_message_is_kept(self) -> None:
+        """Verify a message without filtered words is left alone."""
+        self.message.content = "hello everyone"
+
+        await self.cog.on_message(self.message)
+
+        self.message.delete.assert_not_awaited()
+        self.channel.send.assert_not_awaited()
+
+
+class TestSpamTracker:
+    """Tests for the bounded spam tracker used by ``on_message``."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_target: MagicMock,
+        mock_text_channel: MagicMock,
+        mock_config_file: MagicMock,
+    ) -> None:
+        self._config_patch = patch.object(
+            config, "CONFIG_PATH", str(mock_config_file)
+        )
+        self._config_patch.start()
+
+        self.target = mock_target
+        self.channel = mock_text_channel
+        self.cog = Moderation(mock_bot)
+
+    def teardown_method(self) -> None:
+        self._config_patch.stop()
+
+    def _message(self, author_id: int, content: str = "hello") -> MagicMock:
+        message = MagicMock(spec=discord.Message)
+        message.author = MagicMock(spec=discord.Member)
+        message.author.id = author_id
+        message.guild = self.target.guild
+        message.channel = self.channel
+        message.content = content
+        return message
+
+    def test_spam_settings_bound_at_load(self) -> None:
+        """Verify spam settings are read from the config once, at init."""
+        assert self.cog._spam_threshold == 5
+        assert self.cog._spam_interval == 10.0
+        assert self.cog._mod_log_channel_name == "mod-log"
+
+    async def test_non_positive_interval_skips_sweep(
+        self, mock_bot: MagicMock, mock_config_file: MagicMock
+    ) -> None:
+        """Verify a zero spam interval loads the cog without starting the sweep."""
+        cfg = json.loads(mock_config_file.read_text())
+        mock_config_file.write_text(json.dumps({**cfg, "spam_interval": 0}))
+        cog = Moderation(mock_bot)
+
+        await cog.cog_load()
+
+        assert not cog._sweep_spam_tracker.is_running()
+
+    async def test_tracker_evicts_least_recently_active_member(self) -> None:
+        """Verify the tracker never grows past its cap."""
+        with patch("bot.cogs.moderation._MAX_TRACKED_MEMBERS", 2):
+            for author_id in (1, 2, 1, 3):
+                await self.cog._handle_spam_detection(self._message(author_id), "hello")
+
+        guild_id = self.target.guild.id
+        assert list(self.cog._spam_tracker) == [(guild_id, 1), (guild_id, 3)]
+
+    async def test_spam_bulk_deletes_tracked_messages(self) -> None:
+        """Verify case variants count as spam and are bulk-deleted without a purge."""
+        self.channel.send = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
+        self.channel.delete_messages = AsyncMock()
+
+        variants = ("buy now", "BUY NOW", "Buy Now", "buy NOW", "bUY now")
+        for message_id, content in enumerate(variants, start=1):
+            message = self._message(1, content)
+            message.id = message_id
+            await self.cog._handle_spam_detection(message, content.casefold())
+
+        self.channel.purge.assert_not_awaited()
+        deleted = self.channel.delete_messages.call_args.args[0]
+        assert [m.id for m in deleted] == [1, 2, 3, 4, 5]
+        message.author.timeout.assert_awaited_once()
+
+    async def test_sweep_drops_idle_members(self) -> None:
+        """Verify the background sweep removes records with no recent messages."""
+        with patch("bot.cogs.moderation.time.monotonic", return_value=100.0):
+            await self.cog._handle_spam_detection(self._message(1), "hello")
+        with patch("bot.cogs.moderation.time.monotonic", return_value=105.0):
+            await self.cog._handle_spam_detection(self._message(2), "hello")
+
+        with patch("bot.cogs.moderation.time.monotonic", return_value=112.0):
+            await self.cog._sweep_spam_tracker()
+
+        assert list(self.cog._spam_tracker) == [(self.target.guild.id, 2)]
+
+    async def test_spam_reset_tolerates_record_removed_during_awaits(self) -> None:
+        """Verify the reset after a timeout copes with the record already being gone."""
+
+        async def sweep_while_sending(*args: object, **kwargs: object) -> MagicMock:
+            self.cog._spam_tracker.clear()
+            return MagicMock(delete=AsyncMock())
+
+        self.channel.send = AsyncMock(side_effect=sweep_while_sending)
+        self.channel.delete_messages = AsyncMock()
+
+        for message_id in range(1, 6):
+            message = self._message(1, "spam")
+            message.id = message_id
+            await self.cog._handle_spam_detection(message, "spam")
+
+        message.author.timeout.assert_awaited_once()
+        assert not self.cog._spam_tracker
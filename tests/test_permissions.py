@@ -0,0 +1,93 @@
+"""Tests for the permission check decorators.
+
+Covers the is_moderator and is_admin predicates.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+from discord import app_commands
+
+from bot.utils.permissions import is_admin, is_moderator
+
+
+def _predicate(check: Callable[[Any], Any]) -> Callable[..., Any]:
+    """Return the predicate that *check* attaches to a command callback."""
+
+    async def callback() -> None: ...
+
+    return check(callback).__discord_app_commands_checks__[0]
+
+
+# ===================================================================
+# is_moderator tests
+# ===================================================================
+
+
+class TestIsModerator:
+    """Tests for the ``is_moderator`` check."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_interaction: MagicMock) -> None:
+        self.interaction = mock_interaction
+        self.predicate = _predicate(is_moderator())
+
+    @pytest.mark.parametrize(
+        "perms",
+        [
+            discord.Permissions(manage_messages=True),
+            discord.Permissions(kick_members=True),
+            discord.Permissions(ban_members=True),
+        ],
+    )
+    async def test_any_moderation_permission_passes(
+        self, perms: discord.Permissions
+    ) -> None:
+        self.interaction.user.guild_permissions = perms
+        assert await self.predicate(self.interaction) is True
+
+    async def test_without_moderation_permissions_raises(self) -> None:
+        self.interaction.user.guild_permissions = discord.Permissions(
+            send_messages=True, manage_roles=True
+        )
+        with pytest.raises(app_commands.MissingPermissions) as excinfo:
+            await self.predicate(self.interaction)
+
+        assert excinfo.value.missing_permissions == [
+            "manage_messages",
+            "kick_members",
+            "ban_members",
+        ]
+
+
+# ===================================================================
+# is_admin tests
+# ===================================================================
+
+
+class TestIsAdmin:
+    """Tests for the ``is_admin`` check."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_interaction: MagicMock) -> None:
+        self.interaction = mock_interaction
+        self.predicate = _predicate(is_admin())
+
+    async def test_administrator_passes(self) -> None:
+        self.interaction.user.guild_permissions = discord.Permissions(
+            administrator=True
+        )
+        assert await self.predicate(self.interaction) is True
+
+    async def test_moderator_without_administrator_raises(self) -> None:
+        self.interaction.user.guild_permissions = discord.Permissions(
+            manage_messages=True, kick_members=True, ban_members=True
+        )
+        with pytest.raises(app_commands.MissingPermissions) as excinfo:
+            await self.predicate(self.interaction)
+
+        assert excinfo.value.missing_permissions == ["administrator"]
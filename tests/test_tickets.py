@@ -6,16 +6,120 @@ ticket panel slash command.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 
 from bot import config
-from bot.cogs.tickets import Tickets, TicketControlView, TicketPanelView, _handle_ticket_creation
+from bot.cogs.tickets import (
+    Tickets,
+    TicketControlView,
+    TicketPanelView,
+    _delete_ticket_channel,
+    _handle_ticket_creation,
+    _load_config,
+    _load_config_async,
+    _category_cache,
+    _mod_role_cache,
+    _moderator_roles,
+    _pending_deletes,
+    _sanitize_channel_name,
+    _ticket_category,
+)
 from bot.utils.database import close_ticket, create_ticket, get_open_ticket
 
 
+class TestSanitizeChannelName:
+    """Unit tests for ``_sanitize_channel_name``."""
+
+    def test_lowercases_and_keeps_safe_characters(self) -> None:
+        assert _sanitize_channel_name("User42") == "user42"
+
+    def test_collapses_unsafe_runs_and_hyphens(self) -> None:
+        assert _sanitize_channel_name("a b__--c") == "a-b-c"
+
+    def test_strips_edge_hyphens(self) -> None:
+        assert _sanitize_channel_name("--name!!") == "name"
+
+    def test_falls_back_to_unknown(self) -> None:
+        assert _sanitize_channel_name("!!!") == "unknown"
+
+
+class TestLoadConfig:
+    """Tests for the mtime-cached ``_load_config``."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_config_file: Path) -> None:
+        self.config_file = mock_config_file
+        self._config_patch = patch.object(
+            config, "CONFIG_PATH", str(mock_config_file)
+        )
+        self._config_patch.start()
+
+    def teardown_method(self) -> None:
+        self._config_patch.stop()
+
+    def test_unchanged_file_is_not_reparsed(self) -> None:
+        assert _load_config() is _load_config()
+
+    def test_modified_file_is_reloaded(self) -> None:
+        _load_config()
+        self.config_file.write_text(
+            json.dumps({"ticket_category": "Help Desk"}), encoding="utf-8"
+        )
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert _load_config()["ticket_category"] == "Help Desk"
+
+    async def test_async_load_reads_in_thread_only_when_cold(self) -> None:
+        with patch(
+            "bot.cogs.tickets.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            first = await _load_config_async()
+            second = await _load_config_async()
+
+        assert first is second
+        to_thread.assert_called_once_with(_load_config)
+
+
+class TestTicketCategory:
+    """Tests for the cached ``_ticket_category`` lookup."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.category = MagicMock(spec=discord.CategoryChannel)
+        self.category.id = 700000000000000000
+        self.category.name = "Support Tickets"
+        self.guild = MagicMock(spec=discord.Guild)
+        self.guild.id = 100000000000000000
+        self.guild.categories = [self.category]
+        self.guild.get_channel = MagicMock(return_value=self.category)
+        _category_cache.clear()
+
+    def teardown_method(self) -> None:
+        _category_cache.clear()
+
+    def test_cached_category_skips_name_scan(self) -> None:
+        assert _ticket_category(self.guild, "Support Tickets") is self.category
+        self.guild.categories = []
+
+        assert _ticket_category(self.guild, "Support Tickets") is self.category
+        self.guild.get_channel.assert_called_once_with(self.category.id)
+
+    def test_renamed_category_falls_back_to_scan(self) -> None:
+        _ticket_category(self.guild, "Support Tickets")
+        self.category.name = "Archive"
+
+        assert _ticket_category(self.guild, "Support Tickets") is None
+        assert _ticket_category(self.guild, "Archive") is self.category
+
+
 class TestTicketCreation:
     """Tests for the ticket creation flow."""
 
@@ -27,7 +131,6 @@ class TestTicketCreation:
         mock_guild: MagicMock,
         mock_config_file: MagicMock,
         setup_database: None,
-        tmp_path: MagicMock,
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
@@ -38,11 +141,6 @@ class TestTicketCreation:
         )
         self._config_patch.start()
 
-        self._db_patch = patch.object(
-            config, "DATABASE_PATH", str(tmp_path / "test_bot.db")
-        )
-        self._db_patch.start()
-
         # Create a ticket category in the guild
         category = MagicMock(spec=discord.CategoryChannel)
         category.name = "Support Tickets"
@@ -62,11 +160,26 @@ class TestTicketCreation:
         for role in self.guild.roles:
             role.is_default = MagicMock(return_value=(role == self.guild.default_role))
 
+        _mod_role_cache.clear()
+        _category_cache.clear()
         self.cog = Tickets(self.bot)
 
     def teardown_method(self) -> None:
         self._config_patch.stop()
-        self._db_patch.stop()
+        _mod_role_cache.clear()
+        _category_cache.clear()
+
+    def _add_mod_role(self) -> MagicMock:
+        mod_role = MagicMock(spec=discord.Role)
+        mod_role.id = 800000000000000000
+        mod_role.guild = self.guild
+        mod_role.permissions = discord.Permissions(manage_messages=True)
+        mod_role.is_default = MagicMock(return_value=False)
+        self.guild.roles = [self.guild.default_role, mod_role]
+        self.guild.get_role = MagicMock(
+            side_effect=lambda rid: mod_role if rid == mod_role.id else None
+        )
+        return mod_role
 
     async def test_ticket_creates_channel(self) -> None:
         """Verify a text channel is created for the ticket."""
@@ -82,8 +195,8 @@ class TestTicketCreation:
             self.interaction.user.id,
         )
         assert ticket is not None
-        assert ticket["channel_id"] == self.ticket_channel.id
-        assert ticket["status"] == "open"
+        assert ticket.channel_id == self.ticket_channel.id
+        assert ticket.status == "open"
 
     async def test_ticket_sends_welcome_in_channel(self) -> None:
         """Verify a welcome message is posted in the new ticket channel."""
@@ -110,6 +223,28 @@ class TestTicketCreation:
         view = call_kwargs.kwargs.get("view")
         assert isinstance(view, TicketControlView)
 
+    async def test_ticket_grants_moderator_roles_access(self) -> None:
+        """Verify roles with Manage Messages are added to the overwrites."""
+        mod_role = self._add_mod_role()
+
+        await _handle_ticket_creation(self.interaction)
+
+        overwrites = self.guild.create_text_channel.call_args.kwargs["overwrites"]
+        assert overwrites[mod_role].read_messages is True
+
+    async def test_role_change_refreshes_moderator_roles(self) -> None:
+        """Verify cached moderator roles are recomputed after a role update."""
+        mod_role = self._add_mod_role()
+        assert _moderator_roles(self.guild) == [mod_role]
+
+        # Cached: a change to guild.roles alone is not seen...
+        self.guild.roles = [self.guild.default_role]
+        assert _moderator_roles(self.guild) == [mod_role]
+
+        # ...until a role event invalidates the guild's entry
+        await self.cog.on_guild_role_update(mod_role, mod_role)
+        assert _moderator_roles(self.guild) == []
+
 
 class TestDuplicateTicketPrevention:
     """Tests for preventing duplicate open tickets."""
@@ -122,7 +257,6 @@ class TestDuplicateTicketPrevention:
         mock_guild: MagicMock,
         mock_config_file: MagicMock,
         setup_database: None,
-        tmp_path: MagicMock,
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
@@ -133,11 +267,6 @@ class TestDuplicateTicketPrevention:
         )
         self._config_patch.start()
 
-        self._db_patch = patch.object(
-            config, "DATABASE_PATH", str(tmp_path / "test_bot.db")
-        )
-        self._db_patch.start()
-
         # Create a ticket category
         category = MagicMock(spec=discord.CategoryChannel)
         category.name = "Support Tickets"
@@ -157,7 +286,6 @@ class TestDuplicateTicketPrevention:
 
     def teardown_method(self) -> None:
         self._config_patch.stop()
-        self._db_patch.stop()
 
     async def test_duplicate_ticket_shows_error(self) -> None:
         """Verify an error is returned when user already has an open ticket."""
@@ -190,21 +318,12 @@ class TestTicketClose:
         mock_interaction: MagicMock,
         mock_text_channel: MagicMock,
         setup_database: None,
-        tmp_path: MagicMock,
     ) -> None:
         self.bot = mock_bot
         self.interaction = mock_interaction
         self.channel = mock_text_channel
         self.interaction.channel = self.channel
 
-        self._db_patch = patch.object(
-            config, "DATABASE_PATH", str(tmp_path / "test_bot.db")
-        )
-        self._db_patch.start()
-
-    def teardown_method(self) -> None:
-        self._db_patch.stop()
-
     async def test_close_ticket_updates_db(self) -> None:
         """Verify closing a ticket marks it as 'closed' in the database."""
         # Create a ticket record
@@ -257,8 +376,70 @@ class TestTicketClose:
 
         with patch("bot.cogs.tickets.asyncio.sleep", new_callable=AsyncMock):
             await view.close_ticket_button.callback(self.interaction)
+            # The countdown runs as a background task
+            self.channel.delete.assert_not_awaited()
+            await asyncio.gather(*_pending_deletes)
 
         self.channel.delete.assert_awaited_once_with(reason="Ticket closed")
+        assert await get_open_ticket(
+            self.interaction.guild.id, self.interaction.user.id
+        ) is None
+
+    async def test_failed_delete_keeps_ticket_open(self) -> None:
+        """Verify the ticket stays open if its channel could not be deleted."""
+        await create_ticket(
+            guild_id=self.interaction.guild.id,
+            user_id=self.interaction.user.id,
+            channel_id=self.channel.id,
+        )
+        self.channel.delete.side_effect = discord.Forbidden(
+            MagicMock(status=403), "Missing Permissions"
+        )
+
+        view = TicketControlView()
+
+        with patch("bot.cogs.tickets.asyncio.sleep", new_callable=AsyncMock):
+            await view.close_ticket_button.callback(self.interaction)
+            await asyncio.gather(*_pending_deletes)
+
+        assert await get_open_ticket(
+            self.interaction.guild.id, self.interaction.user.id
+        ) is not None
+        embed = self.channel.send.call_args.kwargs.get("embed")
+        assert "Could Not Close" in embed.title
+
+    async def test_already_deleted_channel_closes_ticket(self) -> None:
+        """Verify a channel deleted by someone else still closes the ticket."""
+        await create_ticket(
+            guild_id=self.interaction.guild.id,
+            user_id=self.interaction.user.id,
+            channel_id=self.channel.id,
+        )
+        self.channel.delete.side_effect = discord.NotFound(
+            MagicMock(status=404), "Unknown Channel"
+        )
+
+        with patch("bot.cogs.tickets.asyncio.sleep", new_callable=AsyncMock):
+            await _delete_ticket_channel(self.channel)
+
+        assert await get_open_ticket(
+            self.interaction.guild.id, self.interaction.user.id
+        ) is None
+        self.channel.send.assert_not_awaited()
+
+    async def test_failed_delete_notice_failure_is_logged(self) -> None:
+        """Verify a failure to post the delete-failure notice doesn't escape."""
+        self.channel.delete.side_effect = discord.HTTPException(
+            MagicMock(status=500), "Server Error"
+        )
+        self.channel.send.side_effect = discord.HTTPException(
+            MagicMock(status=500), "Server Error"
+        )
+
+        with patch("bot.cogs.tickets.asyncio.sleep", new_callable=AsyncMock):
+            await _delete_ticket_channel(self.channel)
+
+        self.channel.send.assert_awaited_once()
 
 
 class TestTicketPanelCommand:
@@ -6,13 +6,18 @@ Covers /serverinfo, /userinfo, and /poll commands.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 from discord.ext import commands
 
-from bot.cogs.utility import Utility, _NUMBER_EMOJIS
+from bot.cogs.utility import (
+    _NUMBER_EMOJIS,
+    _POLL_ANSWER_MAX,
+    _POLL_DURATION,
+    Utility,
+)
 
 
 # ===================================================================
@@ -158,25 +163,32 @@ class TestUserInfoCommand:
         self.guild = mock_guild
         self.cog = Utility(self.bot)
 
-    async def test_userinfo_has_username_field(self) -> None:
-        """Verify the embed includes the Username field."""
+    async def test_userinfo_author_is_username(self) -> None:
+        """Verify the embed author line shows the username."""
         await self.cog.userinfo.callback(
             self.cog, self.interaction, user=self.target
         )
         call_kwargs = self.interaction.response.send_message.call_args
         embed = call_kwargs.kwargs.get("embed")
-        field_names = [f.name for f in embed.fields]
-        assert "Username" in field_names
+        assert embed.author.name == self.target.name
+
+    async def test_userinfo_thumbnail_is_display_avatar(self) -> None:
+        """Verify the thumbnail uses the member's display avatar."""
+        await self.cog.userinfo.callback(
+            self.cog, self.interaction, user=self.target
+        )
+        call_kwargs = self.interaction.response.send_message.call_args
+        embed = call_kwargs.kwargs.get("embed")
+        assert embed.thumbnail.url == self.target.display_avatar.url
 
-    async def test_userinfo_has_id_field(self) -> None:
-        """Verify the embed includes the user ID field."""
+    async def test_userinfo_footer_has_user_id(self) -> None:
+        """Verify the embed footer includes the user ID."""
         await self.cog.userinfo.callback(
             self.cog, self.interaction, user=self.target
         )
         call_kwargs = self.interaction.response.send_message.call_args
         embed = call_kwargs.kwargs.get("embed")
-        id_field = next(f for f in embed.fields if f.name == "ID")
-        assert str(self.target.id) in id_field.value
+        assert str(self.target.id) in embed.footer.text
 
     async def test_userinfo_has_top_role_field(self) -> None:
         """Verify the embed includes the top role."""
@@ -208,15 +220,15 @@ class TestUserInfoCommand:
         field_names = [f.name for f in embed.fields]
         assert "Account Created" in field_names
 
-    async def test_userinfo_has_bot_field(self) -> None:
-        """Verify the embed indicates whether the user is a bot."""
+    async def test_userinfo_flags_bots_in_author(self) -> None:
+        """Verify bot accounts are marked in the author line."""
+        self.target.bot = True
         await self.cog.userinfo.callback(
             self.cog, self.interaction, user=self.target
         )
         call_kwargs = self.interaction.response.send_message.call_args
         embed = call_kwargs.kwargs.get("embed")
-        bot_field = next(f for f in embed.fields if f.name == "Bot")
-        assert bot_field.value == "No"
+        assert embed.author.name == f"{self.target.name} \N{ROBOT FACE}"
 
     async def test_userinfo_defaults_to_author(self) -> None:
         """Verify /userinfo with no target defaults to the command author."""
@@ -247,6 +259,16 @@ class TestUserInfoCommand:
         field_names = [f.name for f in embed.fields]
         assert "Roles" in field_names
 
+    async def test_userinfo_roles_exclude_default_role(self) -> None:
+        """Verify @everyone is left out of the Roles field."""
+        await self.cog.userinfo.callback(
+            self.cog, self.interaction, user=self.target
+        )
+        call_kwargs = self.interaction.response.send_message.call_args
+        embed = call_kwargs.kwargs.get("embed")
+        roles_field = next(f for f in embed.fields if f.name == "Roles")
+        assert roles_field.value == self.target.top_role.mention
+
 
 # ===================================================================
 # /poll tests
@@ -254,7 +276,63 @@ class TestUserInfoCommand:
 
 
 class TestPollCommand:
-    """Tests for the /poll slash command."""
+    """Tests for /poll sending a native Discord poll."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(
+        self,
+        mock_bot: MagicMock,
+        mock_interaction: MagicMock,
+    ) -> None:
+        self.bot = mock_bot
+        self.interaction = mock_interaction
+        self.cog = Utility(self.bot)
+
+    async def test_poll_sends_native_poll(self) -> None:
+        """Verify the question and options are sent as a native poll."""
+        await self.cog.poll.callback(
+            self.cog,
+            self.interaction,
+            question="Best language?",
+            option1="Python",
+            option2="Rust",
+            option3="Go",
+        )
+        call_kwargs = self.interaction.response.send_message.call_args
+        native_poll = call_kwargs.kwargs.get("poll")
+        assert native_poll.question == "Best language?"
+        answers = [answer.text for answer in native_poll.answers]
+        assert answers == ["Python", "Rust", "Go"]
+        assert native_poll.duration == _POLL_DURATION
+
+    async def test_native_poll_adds_no_reactions(self) -> None:
+        """Verify a native poll needs no follow-up reaction requests."""
+        await self.cog.poll.callback(
+            self.cog,
+            self.interaction,
+            question="Pick one",
+            option1="A",
+            option2="B",
+        )
+        self.interaction.original_response.assert_not_awaited()
+
+    async def test_long_option_falls_back_to_embed(self) -> None:
+        """Verify options longer than Discord allows produce an embed poll."""
+        long_option = "x" * (_POLL_ANSWER_MAX + 1)
+        await self.cog.poll.callback(
+            self.cog,
+            self.interaction,
+            question="Pick one",
+            option1="A",
+            option2=long_option,
+        )
+        call_kwargs = self.interaction.response.send_message.call_args
+        assert "poll" not in call_kwargs.kwargs
+        assert long_option in call_kwargs.kwargs["embed"].description
+
+
+class TestEmbedPollCommand:
+    """Tests for the embed-and-reactions /poll fallback."""
 
     @pytest.fixture(autouse=True)
     def _setup(
@@ -266,6 +344,10 @@ class TestPollCommand:
         self.interaction = mock_interaction
         self.cog = Utility(self.bot)
 
+        # Treat every option as too long for a native poll
+        with patch("bot.cogs.utility._POLL_ANSWER_MAX", 0):
+            yield  # type: ignore[misc]
+
     async def test_poll_creates_embed_with_question(self) -> None:
         """Verify the poll embed includes the question."""
         await self.cog.poll.callback(
@@ -309,6 +391,24 @@ class TestPollCommand:
         msg = await self.interaction.original_response()
         assert msg.add_reaction.await_count == 3
 
+    async def test_poll_failed_reaction_does_not_stop_the_rest(self) -> None:
+        """Verify one rejected reaction doesn't prevent the others."""
+        msg = await self.interaction.original_response()
+        msg.add_reaction.side_effect = [
+            discord.HTTPException(MagicMock(status=500), "error"),
+            None,
+            None,
+        ]
+        await self.cog.poll.callback(
+            self.cog,
+            self.interaction,
+            question="Pick one",
+            option1="A",
+            option2="B",
+            option3="C",
+        )
+        assert msg.add_reaction.await_count == 3
+
     async def test_poll_reactions_match_options_count(self) -> None:
         """Verify the number of reactions matches the number of options."""
         await self.cog.poll.callback(
@@ -6,7 +6,10 @@ Covers on_member_join (welcome embed + auto-role), on_member_remove
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
@@ -16,6 +19,55 @@ from bot import config
 from bot.cogs.welcome import Welcome
 
 
+class TestLoadConfig:
+    """Tests for the mtime-cached, thread-offloaded welcome config I/O."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_config_file: MagicMock) -> None:
+        self.config_file = mock_config_file
+        self._config_patch = patch.object(
+            config, "CONFIG_PATH", str(mock_config_file)
+        )
+        self._config_patch.start()
+
+    def teardown_method(self) -> None:
+        self._config_patch.stop()
+
+    async def test_unchanged_file_is_not_reparsed(self) -> None:
+        assert await Welcome._load_config() is await Welcome._load_config()
+
+    async def test_modified_file_is_reloaded(self) -> None:
+        await Welcome._load_config()
+        self.config_file.write_text(
+            json.dumps({"welcome_channel": "lobby"}), encoding="utf-8"
+        )
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert (await Welcome._load_config())["welcome_channel"] == "lobby"
+
+    async def test_save_refreshes_cache(self) -> None:
+        data = {**await Welcome._load_config(), "auto_role": "Verified"}
+        await Welcome._save_config(data)
+
+        assert await Welcome._load_config() is data
+
+    async def test_save_replaces_file_atomically(self) -> None:
+        with patch("bot.cogs.welcome.os.replace", side_effect=OSError):
+            with pytest.raises(OSError):
+                await Welcome._save_config({"auto_role": "Verified"})
+
+        assert json.loads(self.config_file.read_text())["auto_role"] == "Member"
+        assert list(self.config_file.parent.iterdir()) == [self.config_file]
+
+    async def test_warm_cache_skips_worker_thread(self) -> None:
+        await Welcome._load_config()
+        with patch("bot.cogs.welcome.asyncio.to_thread") as to_thread:
+            await Welcome._load_config()
+
+        to_thread.assert_not_called()
+
+
 class TestOnMemberJoin:
     """Tests for the ``on_member_join`` event listener."""
 
@@ -40,6 +92,7 @@ class TestOnMemberJoin:
 
         # Set up welcome channel in the guild
         welcome_channel = MagicMock(spec=discord.TextChannel)
+        welcome_channel.id = 400000000000000001
         welcome_channel.name = "welcome"
         welcome_channel.send = AsyncMock()
         self.welcome_channel = welcome_channel
@@ -47,10 +100,19 @@ class TestOnMemberJoin:
 
         # Set up auto-role
         member_role = MagicMock(spec=discord.Role)
+        member_role.id = 500000000000000001
         member_role.name = "Member"
         self.member_role = member_role
         self.guild.roles = [self.guild.default_role, member_role]
 
+        # ID lookups resolve against the current channel/role lists
+        self.guild.get_channel = lambda cid: next(
+            (c for c in self.guild.text_channels if c.id == cid), None
+        )
+        self.guild.get_role = lambda rid: next(
+            (r for r in self.guild.roles if r.id == rid), None
+        )
+
         self.cog = Welcome(self.bot)
 
     def teardown_method(self) -> None:
@@ -89,6 +151,81 @@ class TestOnMemberJoin:
         # Should not raise, auto-role should still be attempted
         self.member.add_roles.assert_awaited_once()
 
+    async def test_missing_channel_warning_is_throttled(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify a missing welcome channel is logged once per interval, not per join."""
+        self.guild.text_channels = []
+        with caplog.at_level(logging.WARNING, logger="bot.cogs.welcome"):
+            await self.cog.on_member_join(self.member)
+            await self.cog.on_member_join(self.member)
+
+        warnings = [r for r in caplog.records if "Welcome channel" in r.getMessage()]
+        assert len(warnings) == 1
+
+    async def test_channel_create_refreshes_welcome_channel(self) -> None:
+        """Verify a newly created welcome channel is found after the create event."""
+        self.guild.text_channels = []
+        await self.cog.on_member_join(self.member)
+        self.guild.text_channels = [self.welcome_channel]
+        self.welcome_channel.guild = self.guild
+        await self.cog.on_guild_channel_create(self.welcome_channel)
+        await self.cog.on_member_join(self.member)
+
+        self.welcome_channel.send.assert_awaited_once()
+
+    async def test_join_does_not_write_config(self) -> None:
+        """Verify a join with a name-only config leaves config.json untouched."""
+        before = self.config_file.read_bytes()
+        await self.cog.on_member_join(self.member)
+
+        assert self.config_file.read_bytes() == before
+        self.welcome_channel.send.assert_awaited_once()
+
+    async def test_migration_saves_resolved_ids(self) -> None:
+        """Verify the ready-time migration stores the channel and role IDs."""
+        self.bot.guilds = [self.guild]
+        await self.cog._migrate_legacy_ids()
+
+        cfg = json.loads(self.config_file.read_text())
+        assert cfg["welcome_channel_id"] == self.welcome_channel.id
+        assert cfg["auto_role_id"] == self.member_role.id
+        assert cfg["welcome_channel"] == "welcome"
+
+    async def test_migration_write_failure_is_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify a failed migration write is logged instead of raised."""
+        self.bot.guilds = [self.guild]
+        with (
+            patch("bot.cogs.welcome._write_config", side_effect=PermissionError),
+            caplog.at_level(logging.ERROR, logger="bot.cogs.welcome"),
+        ):
+            await self.cog._migrate_legacy_ids()
+
+        assert "Could not save" in caplog.text
+        assert "welcome_channel_id" not in json.loads(self.config_file.read_text())
+
+    async def test_renamed_channel_found_by_id(self) -> None:
+        """Verify the welcome channel is still used after a rename once its ID is stored."""
+        self.bot.guilds = [self.guild]
+        await self.cog._migrate_legacy_ids()
+        await self.cog.on_member_join(self.member)
+        self.welcome_channel.name = "lobby"
+        await self.cog.on_member_join(self.member)
+
+        assert self.welcome_channel.send.await_count == 2
+
+    async def test_role_delete_refreshes_auto_role(self) -> None:
+        """Verify a deleted auto-role is no longer assigned after the delete event."""
+        await self.cog.on_member_join(self.member)
+        self.guild.roles = [self.guild.default_role]
+        self.member_role.guild = self.guild
+        await self.cog.on_guild_role_delete(self.member_role)
+        await self.cog.on_member_join(self.member)
+
+        self.member.add_roles.assert_awaited_once()
+
     async def test_welcome_embed_contains_member_mention(self) -> None:
         """Verify the welcome embed includes the new member's mention."""
         await self.cog.on_member_join(self.member)
@@ -119,6 +256,7 @@ class TestOnMemberRemove:
         self._config_patch.start()
 
         welcome_channel = MagicMock(spec=discord.TextChannel)
+        welcome_channel.id = 400000000000000001
         welcome_channel.name = "welcome"
         welcome_channel.send = AsyncMock()
         self.welcome_channel = welcome_channel
@@ -184,8 +322,9 @@ class TestSetWelcomeCommand:
         self._config_patch.stop()
 
     async def test_setwelcome_updates_config(self) -> None:
-        """Verify /setwelcome writes the new channel name to config.json."""
+        """Verify /setwelcome writes the new channel name and ID to config.json."""
         channel = MagicMock(spec=discord.TextChannel)
+        channel.id = 400000000000000002
         channel.name = "new-welcome"
         channel.mention = "<#new-welcome>"
 
@@ -196,10 +335,12 @@ class TestSetWelcomeCommand:
         # Read back the config file
         updated_cfg = json.loads(self.config_file.read_text())
         assert updated_cfg["welcome_channel"] == "new-welcome"
+        assert updated_cfg["welcome_channel_id"] == channel.id
 
     async def test_setwelcome_sends_success(self) -> None:
         """Verify the command responds with a success embed."""
         channel = MagicMock(spec=discord.TextChannel)
+        channel.id = 400000000000000003
         channel.name = "announcements"
         channel.mention = "<#announcements>"
 
@@ -239,8 +380,9 @@ class TestSetAutoRoleCommand:
         self._config_patch.stop()
 
     async def test_setautorole_updates_config(self) -> None:
-        """Verify /setautorole writes the new role name to config.json."""
+        """Verify /setautorole writes the new role name and ID to config.json."""
         role = MagicMock(spec=discord.Role)
+        role.id = 500000000000000002
         role.name = "Newcomer"
 
         await self.cog.setautorole.callback(
@@ -249,10 +391,12 @@ class TestSetAutoRoleCommand:
 
         updated_cfg = json.loads(self.config_file.read_text())
         assert updated_cfg["auto_role"] == "Newcomer"
+        assert updated_cfg["auto_role_id"] == role.id
 
     async def test_setautorole_sends_success(self) -> None:
         """Verify the command responds with a success embed."""
         role = MagicMock(spec=discord.Role)
+        role.id = 500000000000000003
         role.name = "Verified"
 
         await self.cog.setautorole.callback(
@@ -265,3 +409,22 @@ class TestSetAutoRoleCommand:
         assert embed is not None
         assert "Updated" in embed.title
         assert "Verified" in embed.description
+
+    async def test_concurrent_updates_keep_both_settings(self) -> None:
+        """Verify overlapping config updates don't overwrite each other."""
+        role = MagicMock(spec=discord.Role)
+        role.id = 500000000000000004
+        role.name = "Verified"
+        channel = MagicMock(spec=discord.TextChannel)
+        channel.id = 400000000000000003
+        channel.name = "lobby"
+        channel.mention = "<#lobby>"
+
+        await asyncio.gather(
+            self.cog.setautorole.callback(self.cog, self.interaction, role=role),
+            self.cog.setwelcome.callback(self.cog, self.interaction, channel=channel),
+        )
+
+        updated_cfg = json.loads(self.config_file.read_text())
+        assert updated_cfg["auto_role_id"] == role.id
+        assert updated_cfg["welcome_channel_id"] == channel.id